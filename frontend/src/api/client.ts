@@ -20,6 +20,7 @@ import type {
 class ApiClient {
   private instance: AxiosInstance
   private baseURL: string
+  private getCache = new Map<string, { t: number; p: Promise<any> }>()
 
   constructor(baseURL: string = '/api') {
     this.baseURL = baseURL
@@ -81,6 +82,26 @@ class ApiClient {
     return (response.data as any).data || response.data as T
   }
 
+  // Share one in-flight GET between callers and reuse its result for `ttl` ms
+  private cachedGet<T>(url: string, ttl: number = 5000): Promise<T> {
+    const hit = this.getCache.get(url)
+    if (hit && Date.now() - hit.t < ttl) {
+      return hit.p
+    }
+
+    const p = this.request<T>({ method: 'GET', url })
+    this.getCache.set(url, { t: Date.now(), p })
+
+    // Don't keep serving a failed request for the rest of the TTL
+    p.catch(() => {
+      if (this.getCache.get(url)?.p === p) {
+        this.getCache.delete(url)
+      }
+    })
+
+    return p
+  }
+
   // Generic HTTP methods
   async get<T>(url: string, params?: QueryParams): Promise<T> {
     return this.request({
@@ -118,10 +139,7 @@ class ApiClient {
 
   // Health Check
   async healthCheck(): Promise<{ status: string; timestamp: string }> {
-    return this.request({
-      method: 'GET',
-      url: '/health',
-    })
+    return this.cachedGet('/health')
   }
 
   // Market Data Endpoints
@@ -174,10 +192,7 @@ class ApiClient {
 
   // LLM Endpoints
   async getLLMStatus(): Promise<LLMStatus> {
-    return this.request({
-      method: 'GET',
-      url: '/llm/status',
-    })
+    return this.cachedGet('/llm/status')
   }
 
   async sendChatMessage(request: ChatRequest): Promise<ChatMessage> {
@@ -230,10 +245,7 @@ class ApiClient {
 
   // Vector Database Endpoints
   async getVectorStats(): Promise<VectorStats> {
-    return this.request({
-      method: 'GET',
-      url: '/llm/vector/stats',
-    })
+    return this.cachedGet('/llm/vector/stats')
   }
 
   async searchVectorPatterns(request: VectorSearchRequest): Promise<VectorPattern[]> {
@@ -0,0 +1,24 @@
+import type { Query } from '@tanstack/react-query'
+
+/**
+ * Build a `refetchInterval` that polls at `healthyMs` while the endpoint answers
+ * and backs off exponentially, up to `maxMs`, while it keeps failing.
+ *
+ * Polling already pauses in hidden tabs (`refetchIntervalInBackground` is off by
+ * default), so pair this with `refetchOnWindowFocus` to re-check as soon as the
+ * tab is visible again.
+ */
+export function adaptiveInterval(healthyMs: number, maxMs: number = healthyMs * 12) {
+  return (query: Query<any, any, any, any>): number => {
+    const { status, dataUpdatedAt, errorUpdateCount } = query.state
+    if (status !== 'error') return healthyMs
+
+    // The gap since the last success roughly doubles with every failed poll;
+    // before any success, every error so far is a consecutive failure
+    const backoff = dataUpdatedAt
+      ? Date.now() - dataUpdatedAt
+      : healthyMs * 2 ** errorUpdateCount
+
+    return Math.min(maxMs, Math.max(healthyMs, backoff))
+  }
+}
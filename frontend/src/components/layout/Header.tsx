@@ -10,6 +10,7 @@ import {
 } from '@heroicons/react/24/outline'
 import { useQuery } from '@tanstack/react-query'
 import apiClient from '../../api/client'
+import { adaptiveInterval } from '../../api/polling'
 
 interface HeaderProps {
   onMenuToggle: () => void
@@ -23,7 +24,8 @@ const Header: React.FC<HeaderProps> = ({ onMenuToggle }) => {
   const { data: healthStatus } = useQuery({
     queryKey: ['health'],
     queryFn: () => apiClient.healthCheck(),
-    refetchInterval: 30000, // Check every 30 seconds
+    refetchInterval: adaptiveInterval(5000), // 5s while up, backing off to 1 minute while down
+    refetchOnWindowFocus: true,
     retry: 1,
   })
 
@@ -31,7 +33,8 @@ const Header: React.FC<HeaderProps> = ({ onMenuToggle }) => {
   const { data: llmStatus } = useQuery({
     queryKey: ['llm-status'],
     queryFn: () => apiClient.getLLMStatus(),
-    refetchInterval: 60000, // Check every minute
+    refetchInterval: adaptiveInterval(60000, 300000), // Every minute, backing off to 5 minutes
+    refetchOnWindowFocus: true,
     retry: 1,
   })
 
@@ -21,6 +21,7 @@ import {
   Cell,
 } from 'recharts'
 import apiClient from '@/api/client'
+import { adaptiveInterval } from '@/api/polling'
 import Card from '@/components/ui/Card'
 import LoadingSpinner from '@/components/ui/LoadingSpinner'
 
@@ -51,26 +52,178 @@ const mockMetrics = {
   correlations: 324,
 }
 
+// Formatted once at load rather than on every poll-driven render
+const formattedMetrics = {
+  portfolioValue: mockMetrics.portfolioValue.toLocaleString(),
+  dailyChange: mockMetrics.dailyChange.toLocaleString(),
+}
+
+interface MetricCardProps {
+  icon: typeof ChartBarIcon
+  iconClassName: string
+  label: string
+  value: string | number
+  detail: string
+  detailClassName?: string
+  dotClassName?: string
+  trending?: boolean
+  delay: number
+}
+
+// Memoized so a status poll only re-renders the cards whose values changed
+const MetricCard: React.FC<MetricCardProps> = React.memo(({
+  icon: Icon,
+  iconClassName,
+  label,
+  value,
+  detail,
+  detailClassName = 'text-gray-600',
+  dotClassName,
+  trending = false,
+  delay,
+}) => (
+  <motion.div
+    initial={{ opacity: 0, y: 20 }}
+    animate={{ opacity: 1, y: 0 }}
+    transition={{ delay }}
+  >
+    <Card className="p-6">
+      <div className="flex items-center">
+        <div className="flex-shrink-0">
+          <Icon className={`h-8 w-8 ${iconClassName}`} />
+        </div>
+        <div className="ml-4 flex-1">
+          <p className="text-sm font-medium text-gray-500">{label}</p>
+          <p className="text-2xl font-bold text-gray-900">
+            {value}
+          </p>
+          <div className="flex items-center mt-1">
+            {trending && <ArrowTrendingUpIcon className="h-4 w-4 text-green-500 mr-1" />}
+            {dotClassName && <div className={`w-2 h-2 rounded-full mr-2 ${dotClassName}`} />}
+            <span className={`text-sm ${detailClassName}`}>
+              {detail}
+            </span>
+          </div>
+        </div>
+      </div>
+    </Card>
+  </motion.div>
+))
+
+// The charts only plot static data, so keep them out of the polling re-renders
+const MarketPerformanceCard: React.FC<{ loading: boolean }> = React.memo(({ loading }) => (
+  <motion.div
+    initial={{ opacity: 0, y: 20 }}
+    animate={{ opacity: 1, y: 0 }}
+    transition={{ delay: 0.5 }}
+  >
+    <Card title="Market Performance" subtitle="6-month trend">
+      {loading ? (
+        <div className="h-64 flex items-center justify-center">
+          <LoadingSpinner />
+        </div>
+      ) : (
+        <ResponsiveContainer width="100%" height={300}>
+          <AreaChart data={mockMarketData}>
+            <CartesianGrid strokeDasharray="3 3" stroke="#f0f0f0" />
+            <XAxis 
+              dataKey="date" 
+              stroke="#6b7280"
+              fontSize={12}
+            />
+            <YAxis 
+              stroke="#6b7280"
+              fontSize={12}
+            />
+            <Tooltip 
+              contentStyle={{
+                backgroundColor: '#fff',
+                border: '1px solid #e5e7eb',
+                borderRadius: '8px',
+                boxShadow: '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
+              }}
+            />
+            <Area
+              type="monotone"
+              dataKey="value"
+              stroke="#3b82f6"
+              fill="#3b82f6"
+              fillOpacity={0.3}
+              strokeWidth={2}
+            />
+          </AreaChart>
+        </ResponsiveContainer>
+      )}
+    </Card>
+  </motion.div>
+))
+
+const TopCorrelationsCard: React.FC = React.memo(() => (
+  <motion.div
+    initial={{ opacity: 0, y: 20 }}
+    animate={{ opacity: 1, y: 0 }}
+    transition={{ delay: 0.6 }}
+  >
+    <Card title="Top Correlations" subtitle="Current market pairs">
+      <ResponsiveContainer width="100%" height={300}>
+        <BarChart data={mockCorrelationData} layout="horizontal">
+          <CartesianGrid strokeDasharray="3 3" stroke="#f0f0f0" />
+          <XAxis 
+            type="number"
+            domain={[0, 1]}
+            stroke="#6b7280"
+            fontSize={12}
+          />
+          <YAxis 
+            type="category"
+            dataKey="name"
+            stroke="#6b7280"
+            fontSize={12}
+            width={80}
+          />
+          <Tooltip 
+            contentStyle={{
+              backgroundColor: '#fff',
+              border: '1px solid #e5e7eb',
+              borderRadius: '8px',
+              boxShadow: '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
+            }}
+            formatter={(value: number) => [`${(value * 100).toFixed(1)}%`, 'Correlation']}
+          />
+          <Bar dataKey="correlation" radius={[0, 4, 4, 0]}>
+            {mockCorrelationData.map((entry, index) => (
+              <Cell key={`cell-${index}`} fill={entry.color} />
+            ))}
+          </Bar>
+        </BarChart>
+      </ResponsiveContainer>
+    </Card>
+  </motion.div>
+))
+
 const Dashboard: React.FC = () => {
   // Fetch real-time data
   const { isLoading: healthLoading } = useQuery({
     queryKey: ['health'],
     queryFn: () => apiClient.healthCheck(),
-    refetchInterval: 30000,
+    refetchInterval: adaptiveInterval(5000),
+    refetchOnWindowFocus: true,
   })
 
   const { data: llmStatus } = useQuery({
     queryKey: ['llm-status'],
     queryFn: () => apiClient.getLLMStatus(),
-    refetchInterval: 60000,
+    refetchInterval: adaptiveInterval(60000, 300000),
   })
 
   const { data: vectorStats } = useQuery({
     queryKey: ['vector-stats'],
     queryFn: () => apiClient.getVectorStats(),
-    refetchInterval: 120000,
+    refetchInterval: adaptiveInterval(120000, 600000),
   })
 
+  const totalPatterns = vectorStats?.total_patterns || mockMetrics.totalPatterns
+
   return (
     <div className="space-y-6">
       {/* Page Header */}
@@ -83,201 +236,48 @@ const Dashboard: React.FC = () => {
 
       {/* Key Metrics */}
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.1 }}
-        >
-          <Card className="p-6">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <CurrencyDollarIcon className="h-8 w-8 text-green-600" />
-              </div>
-              <div className="ml-4 flex-1">
-                <p className="text-sm font-medium text-gray-500">Portfolio Value</p>
-                <p className="text-2xl font-bold text-gray-900">
-                  ${mockMetrics.portfolioValue.toLocaleString()}
-                </p>
-                <div className="flex items-center mt-1">
-                  <ArrowTrendingUpIcon className="h-4 w-4 text-green-500 mr-1" />
-                  <span className="text-sm text-green-600">
-                    +${mockMetrics.dailyChange.toLocaleString()} ({mockMetrics.changePercent}%)
-                  </span>
-                </div>
-              </div>
-            </div>
-          </Card>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.2 }}
-        >
-          <Card className="p-6">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <ChartBarIcon className="h-8 w-8 text-blue-600" />
-              </div>
-              <div className="ml-4 flex-1">
-                <p className="text-sm font-medium text-gray-500">Active Correlations</p>
-                <p className="text-2xl font-bold text-gray-900">
-                  {mockMetrics.correlations}
-                </p>
-                <p className="text-sm text-gray-600 mt-1">
-                  Across {mockCorrelationData.length} pairs
-                </p>
-              </div>
-            </div>
-          </Card>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.3 }}
-        >
-          <Card className="p-6">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <CpuChipIcon className="h-8 w-8 text-purple-600" />
-              </div>
-              <div className="ml-4 flex-1">
-                <p className="text-sm font-medium text-gray-500">Vector Patterns</p>
-                <p className="text-2xl font-bold text-gray-900">
-                  {vectorStats?.total_patterns || mockMetrics.totalPatterns}
-                </p>
-                <div className="flex items-center mt-1">
-                  <div className={`w-2 h-2 rounded-full mr-2 ${
-                    vectorStats?.is_trained ? 'bg-green-400' : 'bg-orange-400'
-                  }`} />
-                  <span className="text-sm text-gray-600">
-                    {vectorStats?.index_type || 'FAISS'} Index
-                  </span>
-                </div>
-              </div>
-            </div>
-          </Card>
-        </motion.div>
-
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.4 }}
-        >
-          <Card className="p-6">
-            <div className="flex items-center">
-              <div className="flex-shrink-0">
-                <ClockIcon className="h-8 w-8 text-orange-600" />
-              </div>
-              <div className="ml-4 flex-1">
-                <p className="text-sm font-medium text-gray-500">LLM Queries Today</p>
-                <p className="text-2xl font-bold text-gray-900">
-                  {mockMetrics.llmQueries}
-                </p>
-                <div className="flex items-center mt-1">
-                  <div className={`w-2 h-2 rounded-full mr-2 ${
-                    llmStatus?.model_available ? 'bg-green-400' : 'bg-red-400'
-                  }`} />
-                  <span className="text-sm text-gray-600">
-                    {llmStatus?.model_available ? 'Model Ready' : 'Model Loading'}
-                  </span>
-                </div>
-              </div>
-            </div>
-          </Card>
-        </motion.div>
+        <MetricCard
+          icon={CurrencyDollarIcon}
+          iconClassName="text-green-600"
+          label="Portfolio Value"
+          value={`$${formattedMetrics.portfolioValue}`}
+          detail={`+$${formattedMetrics.dailyChange} (${mockMetrics.changePercent}%)`}
+          detailClassName="text-green-600"
+          trending
+          delay={0.1}
+        />
+        <MetricCard
+          icon={ChartBarIcon}
+          iconClassName="text-blue-600"
+          label="Active Correlations"
+          value={mockMetrics.correlations}
+          detail={`Across ${mockCorrelationData.length} pairs`}
+          delay={0.2}
+        />
+        <MetricCard
+          icon={CpuChipIcon}
+          iconClassName="text-purple-600"
+          label="Vector Patterns"
+          value={totalPatterns}
+          detail={`${vectorStats?.index_type || 'FAISS'} Index`}
+          dotClassName={vectorStats?.is_trained ? 'bg-green-400' : 'bg-orange-400'}
+          delay={0.3}
+        />
+        <MetricCard
+          icon={ClockIcon}
+          iconClassName="text-orange-600"
+          label="LLM Queries Today"
+          value={mockMetrics.llmQueries}
+          detail={llmStatus?.model_available ? 'Model Ready' : 'Model Loading'}
+          dotClassName={llmStatus?.model_available ? 'bg-green-400' : 'bg-red-400'}
+          delay={0.4}
+        />
       </div>
 
       {/* Charts Section */}
       <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-        {/* Market Performance Chart */}
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.5 }}
-        >
-          <Card title="Market Performance" subtitle="6-month trend">
-            {healthLoading ? (
-              <div className="h-64 flex items-center justify-center">
-                <LoadingSpinner />
-              </div>
-            ) : (
-              <ResponsiveContainer width="100%" height={300}>
-                <AreaChart data={mockMarketData}>
-                  <CartesianGrid strokeDasharray="3 3" stroke="#f0f0f0" />
-                  <XAxis 
-                    dataKey="date" 
-                    stroke="#6b7280"
-                    fontSize={12}
-                  />
-                  <YAxis 
-                    stroke="#6b7280"
-                    fontSize={12}
-                  />
-                  <Tooltip 
-                    contentStyle={{
-                      backgroundColor: '#fff',
-                      border: '1px solid #e5e7eb',
-                      borderRadius: '8px',
-                      boxShadow: '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
-                    }}
-                  />
-                  <Area
-                    type="monotone"
-                    dataKey="value"
-                    stroke="#3b82f6"
-                    fill="#3b82f6"
-                    fillOpacity={0.3}
-                    strokeWidth={2}
-                  />
-                </AreaChart>
-              </ResponsiveContainer>
-            )}
-          </Card>
-        </motion.div>
-
-        {/* Correlation Analysis */}
-        <motion.div
-          initial={{ opacity: 0, y: 20 }}
-          animate={{ opacity: 1, y: 0 }}
-          transition={{ delay: 0.6 }}
-        >
-          <Card title="Top Correlations" subtitle="Current market pairs">
-            <ResponsiveContainer width="100%" height={300}>
-              <BarChart data={mockCorrelationData} layout="horizontal">
-                <CartesianGrid strokeDasharray="3 3" stroke="#f0f0f0" />
-                <XAxis 
-                  type="number"
-                  domain={[0, 1]}
-                  stroke="#6b7280"
-                  fontSize={12}
-                />
-                <YAxis 
-                  type="category"
-                  dataKey="name"
-                  stroke="#6b7280"
-                  fontSize={12}
-                  width={80}
-                />
-                <Tooltip 
-                  contentStyle={{
-                    backgroundColor: '#fff',
-                    border: '1px solid #e5e7eb',
-                    borderRadius: '8px',
-                    boxShadow: '0 4px 6px -1px rgba(0, 0, 0, 0.1)',
-                  }}
-                  formatter={(value: number) => [`${(value * 100).toFixed(1)}%`, 'Correlation']}
-                />
-                <Bar dataKey="correlation" radius={[0, 4, 4, 0]}>
-                  {mockCorrelationData.map((entry, index) => (
-                    <Cell key={`cell-${index}`} fill={entry.color} />
-                  ))}
-                </Bar>
-              </BarChart>
-            </ResponsiveContainer>
-          </Card>
-        </motion.div>
+        <MarketPerformanceCard loading={healthLoading} />
+        <TopCorrelationsCard />
       </div>
 
       {/* Recent Activity */}
@@ -307,7 +307,7 @@ const Dashboard: React.FC = () => {
                   Vector database updated with 15 new patterns
                 </p>
                 <p className="text-xs text-gray-500 mt-1">
-                  Total patterns: {vectorStats?.total_patterns || mockMetrics.totalPatterns} • 12 minutes ago
+                  Total patterns: {totalPatterns} • 12 minutes ago
                 </p>
               </div>
             </div>
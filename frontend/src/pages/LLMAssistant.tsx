@@ -1,4 +1,4 @@
-import React, { useState, useRef, useEffect } from 'react'
+import React, { useState, useRef, useEffect, useCallback } from 'react'
 import { motion } from 'framer-motion'
 import { useQuery } from '@tanstack/react-query'
 import {
@@ -11,6 +11,7 @@ import {
   CircleStackIcon
 } from '@heroicons/react/24/outline'
 import apiClient from '@/api/client'
+import { adaptiveInterval } from '@/api/polling'
 import type { ChatMessage } from '@/types'
 import Card from '@/components/ui/Card'
 import LoadingSpinner from '@/components/ui/LoadingSpinner'
@@ -31,16 +32,25 @@ const LLMAssistant: React.FC = () => {
   const { data: llmStatus } = useQuery({
     queryKey: ['llm-status'],
     queryFn: () => apiClient.getLLMStatus(),
-    refetchInterval: 10000, // Check every 10 seconds
+    refetchInterval: adaptiveInterval(10000), // Every 10 seconds, backing off to 2 minutes while down
   })
 
+  // Aborts in-flight chat and search requests when the page unmounts
+  const abortRef = useRef<AbortController | null>(null)
+  useEffect(() => {
+    const controller = new AbortController()
+    abortRef.current = controller
+    return () => controller.abort()
+  }, [])
+
   // Auto-scroll to bottom when new messages arrive
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' })
   }, [messages])
 
-  const handleSendMessage = async () => {
+  const handleSendMessage = useCallback(async () => {
     if (!inputMessage.trim() || isLoading) return
+    const signal = abortRef.current?.signal
 
     const userMessage: ChatMessage = {
       id: Date.now().toString(),
@@ -57,6 +67,7 @@ const LLMAssistant: React.FC = () => {
       // Use the simplified chat endpoint
       const response = await fetch('http://localhost:8000/llm/chat', {
         method: 'POST',
+        signal,
         headers: {
           'Content-Type': 'application/json',
         },
@@ -81,6 +92,7 @@ const LLMAssistant: React.FC = () => {
 
       setMessages(prev => [...prev, assistantMessage])
     } catch (error) {
+      if (signal?.aborted) return
       console.error('Error sending message:', error)
       toast.error('Failed to send message to LLM')
       
@@ -93,17 +105,19 @@ const LLMAssistant: React.FC = () => {
       
       setMessages(prev => [...prev, errorMessage])
     } finally {
-      setIsLoading(false)
+      if (!signal?.aborted) setIsLoading(false)
     }
-  }
+  }, [inputMessage, isLoading])
 
-  const handleVectorSearch = async () => {
+  const handleVectorSearch = useCallback(async () => {
     if (!vectorQuery.trim() || vectorLoading) return
+    const signal = abortRef.current?.signal
 
     setVectorLoading(true)
     try {
       const response = await fetch('http://localhost:8000/llm/vector/search', {
         method: 'POST',
+        signal,
         headers: {
           'Content-Type': 'application/json',
         },
@@ -122,13 +136,14 @@ const LLMAssistant: React.FC = () => {
       setVectorResults(data.data?.results || [])
       toast.success(`Found ${data.data?.count || 0} similar patterns`)
     } catch (error) {
+      if (signal?.aborted) return
       console.error('Error in vector search:', error)
       toast.error('Vector search failed')
       setVectorResults([])
     } finally {
-      setVectorLoading(false)
+      if (!signal?.aborted) setVectorLoading(false)
     }
-  }
+  }, [vectorQuery, vectorLoading])
 
   const handleKeyPress = (e: React.KeyboardEvent) => {
     if (e.key === 'Enter' && !e.shiftKey) {
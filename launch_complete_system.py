@@ -13,54 +13,255 @@ Version: 1.0.0
 """
 
 import os
-import sys
 import time
+import socket
 import subprocess
 import signal
+import atexit
 import threading
-import requests
-from datetime import datetime
 import logging
+from dataclasses import dataclass
+from typing import List, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Every path the launcher uses is anchored here, and children get it as an
+# explicit cwd, so launching from another directory behaves the same
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+FRONTEND_DIR = os.path.join(PROJECT_DIR, 'frontend')
+
+@dataclass(frozen=True)
+class Service:
+"""A server the launcher starts, supervises and waits on."""
+name: str
+label: str
+cmd: List[str]
+port: int
+cwd: Optional[str] = None
+
+API_SERVICE = Service(
+name='api',
+label='API server',
+cmd=[
+'python', '-m', 'uvicorn',
+'src.api.main_enhanced:app',
+'--host', '127.0.0.1',
+'--port', '8000'
+] + (
+# The reloader forks a second process and keeps watching the source tree
+['--reload'] if os.getenv('DEV_RELOAD') else []
+),
+port=8000,
+cwd=PROJECT_DIR
+)
+
+FRONTEND_SERVICE = Service(
+name='frontend',
+label='Frontend server',
+cmd=['npm', 'run', 'dev'],
+port=3001,
+cwd=FRONTEND_DIR
+)
+
+class ServiceSupervisor:
+"""
+Tracks launched services by PID so a relaunch reuses live ones.
+
+PIDs are recorded in .run/services.pid together with each process's boot ID
+and start time. A recorded service is adopted instead of being spawned again
+only while its PID still names that same process, so a recycled PID is never
+adopted or signalled. Each service runs in
+its own session, so stopping it signals exactly its process group (uvicorn's
+reloader and worker together) and never unrelated processes.
+"""
+
+def __init__(self, run_dir=os.path.join(PROJECT_DIR, '.run')):
+self.pidfile = os.path.join(run_dir, 'services.pid')
+self.processes = {} # Services spawned by this launcher
+self.markers = {} # name -> start marker of the recorded process
+self.pids = self._read_pidfile() # Every tracked service, spawned or adopted
+atexit.register(self.stop_all)
+
+def _read_pidfile(self):
+"""Load recorded services, dropping entries whose PID now names another process."""
+pids = {}
+try:
+with open(self.pidfile) as f:
+for line in f:
+fields = line.split()
+if len(fields) != 3 or not fields[1].isdigit():
+continue
+name, pid, marker = fields[0], int(fields[1]), fields[2]
+if self._start_marker(pid) == marker:
+pids[name] = pid
+self.markers[name] = marker
+except OSError:
+pass
+return pids
+
+def _write_pidfile(self):
+os.makedirs(os.path.dirname(self.pidfile), exist_ok=True)
+with open(self.pidfile, 'w') as f:
+f.writelines(f"{name} {pid} {self.markers.get(name) or '-'}\n"
+for name, pid in self.pids.items())
+
+@staticmethod
+def _start_marker(pid):
+"""
+Boot ID and start time of a process, which together identify it uniquely.
+
+Returns None where /proc is unavailable, so recorded services are then
+never adopted.
+"""
+try:
+with open('/proc/sys/kernel/random/boot_id') as f:
+boot_id = f.read().strip()
+with open(f'/proc/{pid}/stat') as f:
+# Fields after the parenthesised command name start at field 3; starttime is field 22
+fields = f.read().rpartition(')')[2].split()
+return f"{boot_id}:{fields[19]}"
+except (OSError, IndexError):
+return None
+
+@classmethod
+def _is_alive(cls, pid, process=None, marker=None):
+if process is not None:
+return process.poll() is None
+# An adopted PID counts only while it still names the recorded process
+return marker is not None and cls._start_marker(pid) == marker
+
+def is_running(self, name):
+"""Whether a tracked service's process is still alive."""
+pid = self.pids.get(name)
+return pid is not None and self._is_alive(pid, self.processes.get(name), self.markers.get(name))
+
+def reuse(self, name):
+"""PID of a live recorded instance of the service, or None if it must be started."""
+if not self.is_running(name):
+return None
+pid = self.pids[name]
+logger.info(f" Reusing running {name} (pid {pid})")
+return pid
+
+def start(self, name, cmd, **popen_kwargs):
+"""Spawn a service in its own session and record its PID."""
+process = subprocess.Popen(cmd, start_new_session=True, **popen_kwargs)
+self.processes[name] = process
+self.pids[name] = process.pid
+self.markers[name] = self._start_marker(process.pid)
+self._write_pidfile()
+return process.pid
+
+def stop(self, name, timeout=5):
+"""Terminate one service's process group, killing it if it outlives the timeout."""
+pid = self.pids.pop(name, None)
+process = self.processes.pop(name, None)
+marker = self.markers.pop(name, None)
+if pid is None or not self._is_alive(pid, process, marker):
+return
+
+logger.info(f" Stopping {name}...")
+self._signal_group(pid, signal.SIGTERM)
+
+deadline = time.monotonic() + timeout
+while time.monotonic() < deadline:
+if not self._is_alive(pid, process, marker):
+return
+time.sleep(0.1)
+
+logger.warning(f" Force killing {name}...")
+self._signal_group(pid, getattr(signal, 'SIGKILL', signal.SIGTERM))
+
+@staticmethod
+def _signal_group(pid, sig):
+try:
+if hasattr(os, 'killpg'):
+os.killpg(pid, sig)
+else:
+os.kill(pid, sig)
+except (ProcessLookupError, PermissionError):
+pass
+
+def stop_all(self):
+"""Stop every tracked service and clear the pidfile."""
+for name in list(self.pids):
+self.stop(name)
+try:
+os.remove(self.pidfile)
+except FileNotFoundError:
+pass
+
+def detach(self):
+"""Leave services running, and their pidfile in place, for the next launch to reuse."""
+atexit.unregister(self.stop_all)
+self.processes = {}
+self.pids = {}
+self.markers = {}
+
 class SystemLauncher:
 """Complete system launcher with health monitoring."""
 
+# Endpoints probed by check_system_health
+HEALTH_PROBES = {
+'api': 'http://localhost:8000/health',
+'frontend': 'http://localhost:3001',
+'llm': 'http://localhost:8000/llm/status',
+'vector_db': 'http://localhost:8000/llm/vector/stats',
+}
+
 def __init__(self):
-self.processes = {}
+self.supervisor = ServiceSupervisor()
 self.running = True
+self._stop = threading.Event() # Set on shutdown to wake any waiting loop at once
 
-def start_api_server(self):
-"""Start the enhanced API server."""
-try:
-logger.info(" Starting Enhanced API Server...")
+# Pooled HTTP session, created on first use so early exits never import requests
+self._http = None
 
-# Activate virtual environment and start API
-api_cmd = [
-'python', '-m', 'uvicorn',
-'src.api.main_enhanced:app',
-'--host', '127.0.0.1',
-'--port', '8000',
-'--reload'
-]
-
-api_process = subprocess.Popen(
-api_cmd,
-stdout=subprocess.PIPE,
-stderr=subprocess.PIPE,
-text=True
-)
+# Log files receiving child process output, closed on shutdown
+self._log_files = []
+
+# uvicorn server and thread when the API runs inside this process
+self._api_server = None
+self._api_thread = None
 
-self.processes['api'] = api_process
+@property
+def http(self):
+"""One pooled keep-alive session for every API/frontend request."""
+if self._http is None:
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+session = requests.Session()
+adapter = HTTPAdapter(
+pool_connections=10,
+pool_maxsize=20,
+max_retries=Retry(total=3, backoff_factor=0.3)
+)
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+session.headers['Connection'] = 'keep-alive'
+self._http = session
+return self._http
+
+def start_api_server(self, wait=True):
+"""Start the enhanced API server, optionally waiting until it is ready."""
+try:
+logger.info(" Starting Enhanced API Server...")
+# LAUNCHER_INPROCESS_API=1 skips a second interpreter's startup and imports
+if os.getenv('LAUNCHER_INPROCESS_API') == '1':
+api_pid = self._serve_api_in_process()
+else:
+api_pid = self._start_service(API_SERVICE)
 logger.info(" API Server started on http://localhost:8000")
 
 # Wait for API to be ready
+if wait:
 self.wait_for_api()
 
-return api_process
+return api_pid
 
 except Exception as e:
 logger.error(f" Failed to start API server: {e}")
@@ -70,62 +271,181 @@ def start_frontend(self):
 """Start the frontend development server."""
 try:
 logger.info(" Starting Frontend Development Server...")
+frontend_pid = self._start_service(FRONTEND_SERVICE, prepare=self._install_frontend_dependencies)
+if frontend_pid is not None:
+logger.info(" Frontend Server starting on http://localhost:3001")
+return frontend_pid
 
-# Change to frontend directory and start dev server
-frontend_cmd = ['npm', 'run', 'dev']
+except Exception as e:
+logger.error(f" Failed to start frontend server: {e}")
+return None
 
-frontend_process = subprocess.Popen(
-frontend_cmd,
-cwd='frontend',
-stdout=subprocess.PIPE,
-stderr=subprocess.PIPE,
-text=True
-)
+def _serve_api_in_process(self):
+"""Run the API on a uvicorn server in a thread of this process; returns this PID."""
+import uvicorn
+from src.api.main_enhanced import app
 
-self.processes['frontend'] = frontend_process
-logger.info(" Frontend Server starting on http://localhost:3001")
+config = uvicorn.Config(app, host='127.0.0.1', port=API_SERVICE.port, log_level='info')
+self._api_server = uvicorn.Server(config)
+self._api_thread = threading.Thread(target=self._api_server.run, name='api-server', daemon=True)
+self._api_thread.start()
+return os.getpid()
 
-return frontend_process
+def _is_service_running(self, service):
+"""Whether a service is still alive, whether supervised or served in-process."""
+if service is API_SERVICE and self._api_thread is not None:
+return self._api_thread.is_alive()
+return self.supervisor.is_running(service.name)
 
-except Exception as e:
-logger.error(f" Failed to start frontend server: {e}")
+def _start_service(self, service, prepare=None):
+"""
+Start a service unless a live instance can be reused; returns its PID.
+
+prepare runs only before a fresh start, and a falsy result aborts it.
+"""
+pid = self.supervisor.reuse(service.name)
+if pid is not None:
+return pid
+if prepare is not None and not prepare():
 return None
+return self.supervisor.start(
+service.name, service.cmd,
+cwd=service.cwd,
+stdout=self._open_process_log(service.name),
+stderr=subprocess.STDOUT
+)
+
+def _install_frontend_dependencies(self):
+"""Install frontend packages on first run, streaming npm output to the console."""
+if os.path.isdir(os.path.join(FRONTEND_DIR, 'node_modules')):
+return True
+
+# npm ci is deterministic and skips dependency resolution when a lockfile exists
+npm_cmd = 'ci' if os.path.isfile(os.path.join(FRONTEND_DIR, 'package-lock.json')) else 'install'
+logger.info(f" Installing frontend dependencies (npm {npm_cmd})...")
 
-def wait_for_api(self, max_attempts=30):
-"""Wait for API server to be ready."""
-for attempt in range(max_attempts):
 try:
-response = requests.get('http://localhost:8000/health', timeout=5)
-if response.status_code == 200:
-logger.info(" API Server is ready!")
+subprocess.run(
+['npm', npm_cmd, '--prefer-offline', '--no-audit', '--no-fund', '--progress=false'],
+cwd=FRONTEND_DIR,
+check=True,
+env={**os.environ, 'NODE_OPTIONS': '--max-old-space-size=4096'}
+)
+except (OSError, subprocess.CalledProcessError) as e:
+logger.error(f" Frontend dependency install failed: {e}")
+return False
+
 return True
-except requests.exceptions.RequestException:
-pass
 
-logger.info(f"⏳ Waiting for API server... ({attempt + 1}/{max_attempts})")
-time.sleep(2)
+def _open_process_log(self, name):
+"""
+Open the output target for a child process.
+
+Output goes to logs/<name>.log rather than an undrained pipe, which would
+block the child once the pipe buffer fills. Set LAUNCHER_LOG=stdout to
+let children write to this console instead.
+"""
+if os.getenv('LAUNCHER_LOG') == 'stdout':
+return None
+
+log_dir = os.path.join(PROJECT_DIR, 'logs')
+os.makedirs(log_dir, exist_ok=True)
+log_file = open(os.path.join(log_dir, f'{name}.log'), 'ab', buffering=0)
+self._log_files.append(log_file)
+return log_file
+
+def wait_for_api(self, max_wait=30):
+"""Wait for API server to be ready."""
+return self._wait_for_ports([API_SERVICE], max_wait)
 
-logger.error(" API server failed to start within timeout period")
+def _wait_for_ports(self, services, max_wait=30):
+"""
+Wait until each service accepts TCP connections on its local port.
+
+uvicorn and vite only bind once startup has finished, so an accepted
+connection means the server is ready; check_system_health verifies the
+HTTP endpoints afterwards.
+All ports are probed from this one thread, starting at 10ms and doubling to
+a 250ms cap, and a service whose process exits is reported at once rather
+than after the timeout.
+"""
+pending = {service.name: service for service in services}
+for service in services:
+logger.info(f"⏳ Waiting for {service.label} on port {service.port}...")
+
+deadline = time.monotonic() + max_wait
+attempt = 0
+
+while pending:
+for service in list(pending.values()):
+with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+sock.settimeout(0.05)
+ready = sock.connect_ex(('127.0.0.1', service.port)) == 0
+
+if ready:
+logger.info(f" {service.label} is ready!")
+del pending[service.name]
+elif not self._is_service_running(service):
+logger.error(f" {service.label} exited during startup")
 return False
 
-def check_system_health(self):
-"""Check system health and display status."""
+if not pending:
+break
+if time.monotonic() >= deadline:
+for service in pending.values():
+logger.error(f" {service.label} failed to start within timeout period")
+return False
+if self._stop.wait(min(0.01 * 2 ** attempt, 0.25)):
+return False
+attempt += 1
+
+return True
+
+async def _probe_all(self, timeout=5):
+"""Probe every health endpoint concurrently, returning {name: (healthy, JSON body or None)}."""
+import asyncio
+import httpx
+
+names = list(self.HEALTH_PROBES)
+limits = httpx.Limits(max_keepalive_connections=20)
+
+async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+responses = await asyncio.gather(
+*(client.get(self.HEALTH_PROBES[name]) for name in names),
+return_exceptions=True
+)
+
+results = {}
+for name, response in zip(names, responses):
+# A failed or slow probe marks only its own component unhealthy
+if isinstance(response, Exception) or response.status_code != 200:
+results[name] = (False, None)
+continue
 try:
-# Check API health
-api_response = requests.get('http://localhost:8000/health', timeout=5)
-api_healthy = api_response.status_code == 200
-api_data = api_response.json() if api_healthy else {}
+results[name] = (True, response.json())
+except ValueError:
+results[name] = (True, None)
+
+return results
+
+def check_system_health(self, timeout=5):
+"""Check system health and display status."""
+import asyncio
 
-# Check frontend (simple port check)
 try:
-frontend_response = requests.get('http://localhost:3001', timeout=5)
-frontend_healthy = frontend_response.status_code == 200
-except:
-frontend_healthy = False
+results = asyncio.run(self._probe_all(timeout))
+
+api_healthy, api_data = results['api']
+api_data = api_data or {}
+frontend_healthy, _ = results['frontend']
+llm_healthy, _ = results['llm']
+vector_healthy, _ = results['vector_db']
 
 logger.info(f"🏥 System Health Check:")
 logger.info(f" API Server: {' Healthy' if api_healthy else ' Unhealthy'}")
 logger.info(f" Frontend: {' Healthy' if frontend_healthy else ' Unhealthy'}")
+logger.info(f" LLM Service: {' Healthy' if llm_healthy else ' Unhealthy'}")
+logger.info(f" Vector Store: {' Healthy' if vector_healthy else ' Unhealthy'}")
 
 if api_healthy and 'components' in api_data:
 components = api_data['components']
@@ -145,7 +465,7 @@ def run_demo_workflow(self):
 try:
 logger.info(" Starting Demo Workflow...")
 
-response = requests.post('http://localhost:8000/demo/full-workflow', timeout=10)
+response = self.http.post('http://localhost:8000/demo/full-workflow', timeout=10)
 
 if response.status_code == 200:
 data = response.json()
@@ -165,13 +485,52 @@ logger.error(f" Demo workflow failed: {e}")
 return None
 
 def monitor_workflow(self, workflow_id):
-"""Monitor workflow progress."""
+"""Monitor workflow progress, streaming status events when the API supports it."""
+try:
+if self._stream_workflow(workflow_id):
+return
+except Exception as e:
+logger.warning(f" Workflow stream unavailable, falling back to polling: {e}")
+
 try:
 while self.running:
-response = requests.get(f'http://localhost:8000/workflow/{workflow_id}/status', timeout=5)
+response = self.http.get(f'http://localhost:8000/workflow/{workflow_id}/status', timeout=5)
 
 if response.status_code == 200:
-data = response.json()
+if self._report_workflow_status(response.json()):
+break
+
+if self._stop.wait(5): # Check every 5 seconds
+break
+
+except Exception as e:
+logger.error(f" Workflow monitoring failed: {e}")
+
+def _stream_workflow(self, workflow_id):
+"""Follow workflow status over Server-Sent Events; returns False if the API doesn't stream."""
+import json
+
+with self.http.get(
+f'http://localhost:8000/workflow/{workflow_id}/stream',
+stream=True,
+headers={'Accept': 'text/event-stream'},
+timeout=(5, None) # Events only arrive on stage transitions
+) as response:
+content_type = response.headers.get('Content-Type', '')
+if response.status_code != 200 or not content_type.startswith('text/event-stream'):
+return False
+
+for line in response.iter_lines(decode_unicode=True):
+if not self.running:
+break
+if line and line.startswith('data:'):
+if self._report_workflow_status(json.loads(line[len('data:'):])):
+break
+
+return True
+
+def _report_workflow_status(self, data):
+"""Log a workflow status update; returns True once the workflow has finished."""
 status = data['status']
 current_stage = data['current_stage']
 completed_stages = len(data['stages_completed'])
@@ -188,12 +547,9 @@ if data.get('duration'):
 logger.info(f" Duration: {data['duration']:.2f}s")
 if data.get('errors'):
 logger.error(f" Errors: {data['errors']}")
-break
-
-time.sleep(5) # Check every 5 seconds
+return True
 
-except Exception as e:
-logger.error(f" Workflow monitoring failed: {e}")
+return False
 
 def display_system_info(self):
 """Display comprehensive system information."""
@@ -227,29 +583,48 @@ logger.info("")
 logger.info("="*80)
 
 def setup_signal_handlers(self):
-"""Setup signal handlers for graceful shutdown."""
+"""
+Setup signal handlers for graceful shutdown.
+
+The handler only raises KeyboardInterrupt, so SIGTERM takes the same path
+as Ctrl+C: whatever the main thread is blocked in is interrupted at once and
+run() tears down in its finally block, outside the handler.
+"""
 def signal_handler(signum, frame):
 logger.info("\n🛑 Shutdown signal received...")
-self.shutdown()
-sys.exit(0)
+raise KeyboardInterrupt
 
 signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 def shutdown(self):
 """Graceful shutdown of all components."""
+if threading.current_thread() is threading.main_thread():
+# A second Ctrl+C must not interrupt teardown halfway through
+signal.signal(signal.SIGINT, signal.SIG_IGN)
+signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
 logger.info(" Shutting down system components...")
 self.running = False
+self._stop.set()
 
-for name, process in self.processes.items():
-if process and process.poll() is None:
-logger.info(f" Stopping {name}...")
-process.terminate()
-try:
-process.wait(timeout=5)
-except subprocess.TimeoutExpired:
-logger.warning(f" Force killing {name}...")
-process.kill()
+# LAUNCHER_KEEP_SERVICES=1 keeps the servers warm for the next launch
+if os.getenv('LAUNCHER_KEEP_SERVICES') == '1':
+logger.info(" Leaving services running for reuse")
+self.supervisor.detach()
+else:
+self.supervisor.stop_all()
+
+if self._api_server is not None:
+self._api_server.should_exit = True
+self._api_thread.join(timeout=5)
+
+if self._http is not None:
+self._http.close()
+
+for log_file in self._log_files:
+log_file.close()
+self._log_files = []
 
 logger.info(" System shutdown complete")
 
@@ -259,18 +634,21 @@ try:
 self.setup_signal_handlers()
 self.display_system_info()
 
-# Start components
-api_process = self.start_api_server()
-if not api_process:
+# Start components back to back; the frontend doesn't depend on the API
+api_pid = self.start_api_server(wait=False)
+if not api_pid:
 logger.error(" Failed to start API server. Exiting.")
 return
 
-frontend_process = self.start_frontend()
-if not frontend_process:
+frontend_pid = self.start_frontend()
+if not frontend_pid:
 logger.error(" Failed to start frontend. Continuing with API only.")
 
-# Wait a bit for services to start
-time.sleep(5)
+# Wait for both services together, so startup takes the slower of the two
+services = [API_SERVICE]
+if frontend_pid:
+services.append(FRONTEND_SERVICE)
+self._wait_for_ports(services)
 
 # Health check
 if self.check_system_health():
@@ -297,8 +675,7 @@ logger.info("")
 
 # Keep running
 try:
-while self.running:
-time.sleep(60) # Health check every minute
+while not self._stop.wait(60): # Health check every minute
 if not self.check_system_health():
 logger.warning(" System health degraded")
 except KeyboardInterrupt:
@@ -313,4 +690,7 @@ self.shutdown()
 
 if __name__ == "__main__":
 launcher = SystemLauncher()
+try:
 launcher.run()
+except KeyboardInterrupt:
+pass # Already shut down by run()
@@ -12,10 +12,69 @@ python quick_start.py
 
 import os
 import sys
+import hashlib
 import subprocess
 import platform
 from pathlib import Path
 
+# Virtual environment scripts directory, resolved once for every step
+_IS_WINDOWS = platform.system() == "Windows"
+_VENV_BIN = Path("correlation_env/Scripts" if _IS_WINDOWS else "correlation_env/bin")
+
+# Markers for setup steps that already succeeded; kept inside the virtual
+# environment so recreating it also clears them
+_STEP_CACHE_DIR = Path("correlation_env/.quick_start")
+
+# Template written to .env.example when the repo doesn't ship one
+_ENV_TEMPLATE = """# Environment Variables for Multi-Market Correlation Engine
+# Get your free API keys:
+
+# FRED API (Federal Reserve Economic Data) - FREE
+# Get at: https://fred.stlouisfed.org/docs/api/api_key.html
+FRED_API_KEY=your_fred_api_key_here
+
+# Alpha Vantage API (Backup data source) - FREE
+# Get at: https://www.alphavantage.co/support/#api-key
+ALPHA_VANTAGE_KEY=your_alpha_vantage_key_here
+
+# Database Configuration
+DATABASE_URL=sqlite:///data/market_data.db
+
+# Logging Configuration
+LOG_LEVEL=INFO
+LOG_FILE=logs/correlation_engine.log
+"""
+
+# Run inside the virtual environment to check that the core packages are
+# installed. It locates them with find_spec instead of importing them, since
+# importing streamlit alone takes seconds the setup check doesn't need
+_IMPORT_TEST_SCRIPT = """
+import sys
+from importlib.util import find_spec
+missing = [name for name in ("pandas", "numpy", "yfinance", "streamlit") if find_spec(name) is None]
+if missing: sys.exit("Missing packages: " + ", ".join(missing))
+print(" All core packages are installed!")
+"""
+
+def _step_cache_key(step_name):
+"""Key a setup step on the requirements file and the virtual environment it ran against."""
+parts = [step_name]
+for path in (Path("requirements.txt"), Path("correlation_env/pyvenv.cfg")):
+try:
+parts.append(f"{path}:{path.stat().st_mtime_ns}")
+except FileNotFoundError:
+parts.append(f"{path}:missing")
+return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+def _step_is_cached(step_name):
+"""Check whether a step succeeded with the current requirements and environment."""
+return (_STEP_CACHE_DIR / _step_cache_key(step_name)).exists()
+
+def _mark_step_cached(step_name):
+"""Record that a step succeeded, so unchanged reruns can skip it."""
+_STEP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+(_STEP_CACHE_DIR / _step_cache_key(step_name)).write_text("ok")
+
 def print_header():
 """Print welcome header."""
 print("=" * 60)
@@ -66,20 +125,28 @@ def install_dependencies():
 """Install required dependencies."""
 print("\n📍 Installing dependencies...")
 
-# Determine the activation script path
-system = platform.system()
-if system == "Windows":
-pip_path = Path("correlation_env/Scripts/pip")
-else:
-pip_path = Path("correlation_env/bin/pip")
-
+pip_path = _VENV_BIN / "pip"
 if not pip_path.exists():
 print(" Virtual environment pip not found")
 return False
 
+if _step_is_cached("install_dependencies"):
+print(" Dependencies already installed (requirements.txt unchanged)")
+return True
+
 try:
-subprocess.run([str(pip_path), "install", "--upgrade", "pip"], check=True)
-subprocess.run([str(pip_path), "install", "-r", "requirements.txt"], check=True)
+# One pip run upgrades pip and installs the requirements; going through
+# python -m pip lets pip replace itself on Windows too
+subprocess.run(
+[
+str(_VENV_BIN / "python"), "-m", "pip", "install",
+"--no-input", "--disable-pip-version-check",
+"--upgrade", "pip",
+"-r", "requirements.txt"
+],
+check=True
+)
+_mark_step_cached("install_dependencies")
 print(" Dependencies installed successfully")
 return True
 except subprocess.CalledProcessError:
@@ -116,35 +183,15 @@ if env_file.exists():
 print(" .env file already exists")
 return True
 
-if not env_example.exists():
+if env_example.exists():
+template = env_example.read_text()
+else:
 # Create a basic .env.example
-env_content = """# Environment Variables for Multi-Market Correlation Engine
-# Get your free API keys:
-
-# FRED API (Federal Reserve Economic Data) - FREE
-# Get at: https://fred.stlouisfed.org/docs/api/api_key.html
-FRED_API_KEY=your_fred_api_key_here
-
-# Alpha Vantage API (Backup data source) - FREE
-# Get at: https://www.alphavantage.co/support/#api-key
-ALPHA_VANTAGE_KEY=your_alpha_vantage_key_here
-
-# Database Configuration
-DATABASE_URL=sqlite:///data/market_data.db
-
-# Logging Configuration
-LOG_LEVEL=INFO
-LOG_FILE=logs/correlation_engine.log
-"""
-with open(".env.example", "w") as f:
-f.write(env_content)
+template = _ENV_TEMPLATE
+env_example.write_text(template)
 
-# Copy to .env
-with open(".env.example", "r") as f:
-content = f.read()
-
-with open(".env", "w") as f:
-f.write(content)
+# Copy to .env (from memory; no need to read back a file we just wrote)
+env_file.write_text(template)
 
 print(" .env file created from template")
 print(" Remember to add your actual API keys to the .env file")
@@ -154,28 +201,20 @@ def test_imports():
 """Test basic imports."""
 print("\n📍 Testing core imports...")
 
-# Determine python path in virtual environment
-system = platform.system()
-if system == "Windows":
-python_path = Path("correlation_env/Scripts/python")
-else:
-python_path = Path("correlation_env/bin/python")
-
-test_script = """
-import pandas as pd
-import numpy as np
-import yfinance as yf
-import streamlit as st
-print(" All core packages imported successfully!")
-"""
+python_path = _VENV_BIN / "python"
+
+if _step_is_cached("test_imports"):
+print(" Core imports already verified (requirements.txt unchanged)")
+return True
 
 try:
 result = subprocess.run(
-[str(python_path), "-c", test_script],
+[str(python_path), "-c", _IMPORT_TEST_SCRIPT],
 capture_output=True,
 text=True,
 check=True
 )
+_mark_step_cached("test_imports")
 print(result.stdout.strip())
 return True
 except subprocess.CalledProcessError as e:
@@ -188,8 +227,7 @@ print("\n" + "=" * 60)
 print(" Quick Start Complete!")
 print("=" * 60)
 
-system = platform.system()
-if system == "Windows":
+if _IS_WINDOWS:
 activate_cmd = "correlation_env\\Scripts\\activate"
 else:
 activate_cmd = "source correlation_env/bin/activate"
@@ -0,0 +1,27 @@
+"""
+Optional Numba support
+======================
+
+Shared import of numba's ``njit`` and ``prange`` for the kernel modules.
+Without numba the decorator is a no-op and ``prange`` is ``range``, so the
+kernels stay importable and run as plain Python.
+
+Author: Multi-Market Correlation Engine Team
+Version: 1.0.0
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels stay importable without numba."""
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+
+__all__ = ['NUMBA_AVAILABLE', 'njit', 'prange']
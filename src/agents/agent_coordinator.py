@@ -4,21 +4,32 @@ Agent Coordinator for Multi-Market Correlation Engine
 This module coordinates multiple agents and manages the overall system workflow.
 """
 
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+import copy
 import time
 import json
+import sched
 import threading
+import weakref
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
-import schedule
 import logging
 
 from .base_agent import BaseAgent, Task, TaskPriority, AgentStatus, agent_registry
-from .data_collection_agent import DataCollectionAgent
-from .analysis_agent import AnalysisAgent
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 class AgentCoordinator:
@@ -34,6 +45,16 @@ class AgentCoordinator:
     - Error handling and recovery
     """
     
+    # Analyses queued by the emergency workflow, in submission order
+    _EMERGENCY_ANALYSES = ('correlation_analysis', 'volatility_analysis', 'network_analysis')
+    
+    # Workflow name -> name of the method that starts it
+    _WORKFLOWS = {
+        'full_market_analysis': '_execute_full_market_analysis',
+        'data_collection_and_analysis': '_execute_data_collection_and_analysis',
+        'emergency_analysis': '_execute_emergency_analysis',
+    }
+    
     def __init__(self, config: Optional[Dict] = None):
         """
         Initialize the agent coordinator.
@@ -51,7 +72,8 @@ class AgentCoordinator:
             'health_check_interval': 600,  # 10 minutes
             'symbols': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA'],
             'auto_start_agents': True,
-            'enable_scheduling': True
+            'enable_scheduling': True,
+            'max_message_queue': 10000
         }
         
         if config:
@@ -60,12 +82,40 @@ class AgentCoordinator:
         self.config = default_config
         self.agents = {}
         self.workflows = {}
+        # Workflow ids bucketed by status, kept in step with self.workflows
+        self._workflows_by_status = defaultdict(set)
+        # Task id -> id of the running workflow waiting on it
+        self._task_workflows = {}
+        # Held while a workflow queues and registers its tasks, so a task that
+        # finishes straight away is still matched to its workflow
+        self._workflow_lock = threading.RLock()
         self.system_status = 'stopped'
-        self.message_queue = []
+        # (received_at epoch, message) pairs, oldest first; once full, the
+        # oldest entries are dropped as new ones arrive
+        self.message_queue = deque(maxlen=self.config['max_message_queue'])
+        self._msgs_since_sweep = 0
+        self._last_sweep = time.monotonic()
+        
+        # Short-lived (monotonic time, result) snapshots for status probes
+        self._status_cache = (0.0, None)
+        self._health_cache = (0.0, None)
+        self.status_cache_ttl = 2.0
+        self._iso_str = ''
+        self._iso_expires_at = 0.0
+        
+        # Inter-agent message handlers keyed by message_type
+        self._msg_handlers = {
+            'data_available': self._on_data_available,
+            'analysis_complete': self._on_analysis_complete,
+            'task_finished': self._on_task_finished,
+        }
         
         # Scheduling
         self.scheduler_active = False
         self.scheduler_thread = None
+        self._stop_evt = threading.Event()
+        # Heap of pending jobs; waits on the stop event so shutdown is immediate
+        self._sched = sched.scheduler(time.monotonic, self._stop_evt.wait)
         
         # Logging
         self.logger = self._setup_logger()
@@ -91,8 +141,13 @@ class AgentCoordinator:
     def _initialize_agents(self):
         """Initialize all agents"""
         try:
+            # Agent modules pull in pandas and the data/model stacks, so only
+            # import the ones this coordinator actually runs
+            
             # Initialize data collection agent
             if self.config['enable_data_collection']:
+                from .data_collection_agent import DataCollectionAgent
+                
                 data_agent_config = {
                     'collection_interval': self.config['collection_interval'],
                     'symbols': self.config['symbols'],
@@ -104,6 +159,8 @@ class AgentCoordinator:
             
             # Initialize analysis agent
             if self.config['enable_analysis']:
+                from .analysis_agent import AnalysisAgent
+                
                 analysis_agent_config = {
                     'analysis_interval': self.config['analysis_interval'],
                     'symbols': self.config['symbols']
@@ -116,63 +173,98 @@ class AgentCoordinator:
             self._setup_agent_communication()
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize agents: {e}")
+            self.logger.error("Failed to initialize agents: %s", e)
             raise
     
     def _setup_agent_communication(self):
         """Setup communication between agents"""
+        # Agents only hold a weak reference back to the coordinator, so a
+        # stopped coordinator can be collected while its agents live on
+        handler_ref = weakref.WeakMethod(self._handle_agent_message)
+        
+        def forward(message: Dict[str, Any]):
+            handler = handler_ref()
+            if handler is not None:
+                handler(message)
+        
         # Data collector sends messages to analyzer when data is available
         if 'data_collector' in self.agents:
-            self.agents['data_collector'].subscribe_to_messages(self._handle_agent_message)
+            self.agents['data_collector'].subscribe_to_messages(forward)
         
         if 'analyzer' in self.agents:
-            self.agents['analyzer'].subscribe_to_messages(self._handle_agent_message)
+            self.agents['analyzer'].subscribe_to_messages(forward)
     
     def _handle_agent_message(self, message: Dict[str, Any]):
         """Handle messages between agents"""
         try:
-            sender_id = message.get('sender_id')
-            recipient_id = message.get('recipient_id')
             message_type = message.get('message_type')
             data = message.get('data', {})
             
-            self.logger.debug(f"Message from {sender_id} to {recipient_id}: {message_type}")
+            self.logger.debug(
+                "Message from %s to %s: %s",
+                message.get('sender_id'), message.get('recipient_id'), message_type
+            )
             
             # Store message for monitoring
-            self.message_queue.append(message)
+            self.message_queue.append((time.time(), message))
             
             # Handle specific message types
-            if message_type == 'data_available' and recipient_id == 'analysis-agent-001':
-                # Trigger analysis when new data is available
-                if 'analyzer' in self.agents:
-                    symbols = data.get('symbols', self.config['symbols'])
-                    self.agents['analyzer'].create_task(
-                        "Data-Triggered Analysis",
-                        {
-                            'type': 'correlation_analysis',
-                            'symbols': symbols
-                        },
-                        priority=TaskPriority.MEDIUM
-                    )
-            
-            elif message_type == 'analysis_complete':
-                # Handle analysis completion
-                self.logger.info("Analysis completed, results available")
-                # Could trigger reporting here
+            handler = self._msg_handlers.get(message_type)
+            if handler:
+                handler(message, data)
             
-            # Clean old messages
-            self._cleanup_old_messages()
+            # Clean old messages every 1000 messages or once a minute; the
+            # queue is only a monitoring buffer, so a lazy sweep is enough
+            self._msgs_since_sweep += 1
+            now = time.monotonic()
+            if self._msgs_since_sweep >= 1000 or now - self._last_sweep > 60:
+                self._cleanup_old_messages()
+                self._msgs_since_sweep = 0
+                self._last_sweep = now
             
         except Exception as e:
-            self.logger.error(f"Error handling agent message: {e}")
+            self.logger.error("Error handling agent message: %s", e)
+    
+    def _on_data_available(self, message: Dict[str, Any], data: Dict[str, Any]):
+        """Trigger analysis when new data is available"""
+        if message.get('recipient_id') != 'analysis-agent-001' or 'analyzer' not in self.agents:
+            return
+        
+        symbols = data.get('symbols', self.config['symbols'])
+        self.agents['analyzer'].create_task(
+            "Data-Triggered Analysis",
+            {
+                'type': 'correlation_analysis',
+                'symbols': symbols
+            },
+            priority=TaskPriority.MEDIUM
+        )
+    
+    def _on_analysis_complete(self, message: Dict[str, Any], data: Dict[str, Any]):
+        """Handle analysis completion"""
+        self.logger.info("Analysis completed, results available")
+        # Could trigger reporting here
+    
+    def _on_task_finished(self, message: Dict[str, Any], data: Dict[str, Any]):
+        """Complete a workflow once the last task it is waiting on has run"""
+        with self._workflow_lock:
+            workflow_id = self._task_workflows.pop(data.get('task_id'), None)
+            if workflow_id is None:
+                return
+            
+            workflow = self.workflows[workflow_id]
+            workflow['pending_tasks'].discard(data['task_id'])
+            workflow['task_results'][data['task_id']] = 'completed' if data.get('succeeded') else 'failed'
+            if not workflow['pending_tasks']:
+                failed = 'failed' in workflow['task_results'].values()
+                self._mark_workflow_done(workflow_id, 'failed' if failed else 'completed')
     
     def _cleanup_old_messages(self):
         """Clean up old messages from the queue"""
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        self.message_queue = [
-            msg for msg in self.message_queue
-            if datetime.fromisoformat(msg['timestamp']) > cutoff_time
-        ]
+        cutoff = time.time() - 3600
+        queue = self.message_queue
+        while queue and queue[0][0] < cutoff:
+            queue.popleft()
     
     def start_system(self):
         """Start the entire multi-agent system"""
@@ -181,9 +273,7 @@ class AgentCoordinator:
             
             # Start all agents
             if self.config['auto_start_agents']:
-                for agent_name, agent in self.agents.items():
-                    agent.start()
-                    self.logger.info(f"Started {agent_name}")
+                self._run_on_agents(self._start_agent, "Started")
             
             # Start scheduling if enabled
             if self.config['enable_scheduling']:
@@ -194,11 +284,13 @@ class AgentCoordinator:
                 self.agents['data_collector'].start_scheduled_collection()
             
             self.system_status = 'running'
+            self._invalidate_status_cache()
             self.logger.info("Multi-agent system started successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to start system: {e}")
+            self.logger.error("Failed to start system: %s", e)
             self.system_status = 'error'
+            self._invalidate_status_cache()
             raise
     
     def stop_system(self):
@@ -213,16 +305,57 @@ class AgentCoordinator:
             if 'data_collector' in self.agents:
                 self.agents['data_collector'].stop_scheduled_collection()
             
-            # Stop all agents
-            for agent_name, agent in self.agents.items():
-                agent.stop()
-                self.logger.info(f"Stopped {agent_name}")
+            # Stop all agents and drop them from the global registry
+            self._run_on_agents(self._stop_agent, "Stopped")
             
             self.system_status = 'stopped'
+            self._invalidate_status_cache()
             self.logger.info("Multi-agent system stopped")
             
         except Exception as e:
-            self.logger.error(f"Error stopping system: {e}")
+            self.logger.error("Error stopping system: %s", e)
+    
+    def _run_on_agents(self, action, verb: str):
+        """
+        Apply action(agent) to every agent concurrently.
+        
+        Every agent is attempted even if some fail; the first failure is
+        re-raised once all of them have finished.
+        """
+        if not self.agents:
+            return
+        
+        first_error = None
+        with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            futures = {
+                agent_name: executor.submit(action, agent)
+                for agent_name, agent in self.agents.items()
+            }
+            for agent_name, future in futures.items():
+                try:
+                    future.result()
+                    self.logger.info("%s %s", verb, agent_name)
+                except Exception as e:
+                    self.logger.error("Failed on %s: %s", agent_name, e)
+                    if first_error is None:
+                        first_error = e
+        
+        if first_error is not None:
+            raise first_error
+    
+    @staticmethod
+    def _start_agent(agent: BaseAgent):
+        """Register an agent globally and start it"""
+        agent_registry.register_agent(agent)
+        agent.start()
+    
+    @staticmethod
+    def _stop_agent(agent: BaseAgent):
+        """Stop an agent, dropping it from the global registry if it is there"""
+        if agent_registry.get_agent(agent.agent_id) is agent:
+            agent_registry.unregister_agent(agent.agent_id)
+        else:
+            agent.stop()
     
     def start_scheduling(self):
         """Start system-wide scheduling"""
@@ -230,19 +363,21 @@ class AgentCoordinator:
             self.logger.warning("Scheduler already active")
             return
         
+        self._stop_evt.clear()
+        self.scheduler_active = True
+        
         # Schedule system health checks
-        schedule.every(self.config['health_check_interval'] // 60).minutes.do(
-            self._schedule_health_check
+        self._schedule_recurring(
+            lambda: self.config['health_check_interval'], self._schedule_health_check
         )
         
         # Schedule comprehensive analysis
-        schedule.every().day.at("08:00").do(self._schedule_comprehensive_analysis)
+        self._schedule_recurring(lambda: self._seconds_until(8), self._schedule_comprehensive_analysis)
         
         # Schedule system cleanup
-        schedule.every().day.at("02:00").do(self._schedule_system_cleanup)
+        self._schedule_recurring(lambda: self._seconds_until(2), self._schedule_system_cleanup)
         
         # Start scheduler thread
-        self.scheduler_active = True
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
@@ -251,7 +386,12 @@ class AgentCoordinator:
     def stop_scheduling(self):
         """Stop system-wide scheduling"""
         self.scheduler_active = False
-        schedule.clear()
+        self._stop_evt.set()
+        for event in self._sched.queue:
+            try:
+                self._sched.cancel(event)
+            except ValueError:
+                pass  # Already ran
         
         if self.scheduler_thread and self.scheduler_thread.is_alive():
             self.scheduler_thread.join(timeout=5.0)
@@ -260,18 +400,40 @@ class AgentCoordinator:
     
     def _run_scheduler(self):
         """Run the system scheduler"""
-        while self.scheduler_active:
+        # Sleeps until the next job is due and returns once stop_scheduling
+        # has emptied the queue
+        try:
+            self._sched.run()
+        except Exception as e:
+            self.logger.error("Scheduler error: %s", e)
+    
+    def _schedule_recurring(self, next_delay, job):
+        """Queue job to run after next_delay() seconds, re-queueing it after every run"""
+        def run():
+            if not self.scheduler_active:
+                return
             try:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                job()
             except Exception as e:
-                self.logger.error(f"Scheduler error: {e}")
-                time.sleep(60)
+                self.logger.error("Scheduled job %s failed: %s", job.__name__, e)
+            if self.scheduler_active:
+                self._sched.enter(next_delay(), 1, run)
+        
+        self._sched.enter(next_delay(), 1, run)
+    
+    @staticmethod
+    def _seconds_until(hour: int) -> float:
+        """Seconds from now until the next local hour:00"""
+        now = datetime.now()
+        target = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return (target - now).total_seconds()
     
     def _schedule_health_check(self):
         """Schedule a system health check"""
         try:
-            health_status = self.get_system_health()
+            health_status = self.get_system_health(force=True)
             
             # Check for unhealthy agents
             unhealthy_agents = [
@@ -280,11 +442,11 @@ class AgentCoordinator:
             ]
             
             if unhealthy_agents:
-                self.logger.warning(f"Unhealthy agents detected: {unhealthy_agents}")
+                self.logger.warning("Unhealthy agents detected: %s", unhealthy_agents)
                 # Could implement recovery logic here
             
         except Exception as e:
-            self.logger.error(f"Health check failed: {e}")
+            self.logger.error("Health check failed: %s", e)
     
     def _schedule_comprehensive_analysis(self):
         """Schedule a comprehensive analysis"""
@@ -315,21 +477,23 @@ class AgentCoordinator:
         """Execute a predefined workflow"""
         parameters = parameters or {}
         
-        if workflow_name == 'full_market_analysis':
-            return self._execute_full_market_analysis(parameters)
-        elif workflow_name == 'data_collection_and_analysis':
-            return self._execute_data_collection_and_analysis(parameters)
-        elif workflow_name == 'emergency_analysis':
-            return self._execute_emergency_analysis(parameters)
-        else:
+        method_name = self._WORKFLOWS.get(workflow_name)
+        if method_name is None:
             raise ValueError(f"Unknown workflow: {workflow_name}")
+        with self._workflow_lock:
+            return getattr(self, method_name)(parameters)
+    
+    @classmethod
+    def available_workflows(cls) -> List[str]:
+        """Names accepted by execute_workflow"""
+        return list(cls._WORKFLOWS)
     
     def _execute_full_market_analysis(self, parameters: Dict[str, Any]) -> str:
         """Execute full market analysis workflow"""
         symbols = parameters.get('symbols', self.config['symbols'])
         workflow_id = f"full_analysis_{int(time.time())}"
         
-        self.logger.info(f"Starting full market analysis workflow: {workflow_id}")
+        self.logger.info("Starting full market analysis workflow: %s", workflow_id)
         
         workflow_tasks = []
         
@@ -344,13 +508,7 @@ class AgentCoordinator:
             workflow_tasks.append(('analysis', task_id))
         
         # Store workflow
-        self.workflows[workflow_id] = {
-            'name': 'full_market_analysis',
-            'parameters': parameters,
-            'tasks': workflow_tasks,
-            'status': 'running',
-            'started_at': datetime.now().isoformat()
-        }
+        self._store_workflow(workflow_id, 'full_market_analysis', parameters, workflow_tasks)
         
         return workflow_id
     
@@ -359,7 +517,7 @@ class AgentCoordinator:
         symbols = parameters.get('symbols', self.config['symbols'])
         workflow_id = f"collect_analyze_{int(time.time())}"
         
-        self.logger.info(f"Starting data collection and analysis workflow: {workflow_id}")
+        self.logger.info("Starting data collection and analysis workflow: %s", workflow_id)
         
         workflow_tasks = []
         
@@ -373,13 +531,7 @@ class AgentCoordinator:
             task_id = self.agents['analyzer'].force_analysis('correlation_analysis', symbols)
             workflow_tasks.append(('correlation_analysis', task_id))
         
-        self.workflows[workflow_id] = {
-            'name': 'data_collection_and_analysis',
-            'parameters': parameters,
-            'tasks': workflow_tasks,
-            'status': 'running',
-            'started_at': datetime.now().isoformat()
-        }
+        self._store_workflow(workflow_id, 'data_collection_and_analysis', parameters, workflow_tasks)
         
         return workflow_id
     
@@ -388,14 +540,14 @@ class AgentCoordinator:
         symbols = parameters.get('symbols', self.config['symbols'])
         workflow_id = f"emergency_{int(time.time())}"
         
-        self.logger.warning(f"Starting emergency analysis workflow: {workflow_id}")
+        self.logger.warning("Starting emergency analysis workflow: %s", workflow_id)
         
         workflow_tasks = []
         
         # High priority analysis
         if 'analyzer' in self.agents:
             # Create multiple high-priority tasks
-            for analysis_type in ['correlation_analysis', 'volatility_analysis', 'network_analysis']:
+            for analysis_type in self._EMERGENCY_ANALYSES:
                 task = self.agents['analyzer'].create_task(
                     f"Emergency {analysis_type}",
                     {
@@ -406,15 +558,54 @@ class AgentCoordinator:
                 )
                 workflow_tasks.append((analysis_type, task.id))
         
+        self._store_workflow(workflow_id, 'emergency_analysis', parameters, workflow_tasks)
+        
+        return workflow_id
+    
+    def _store_workflow(self, workflow_id: str, name: str, parameters: Dict[str, Any],
+                        tasks: List[tuple]):
+        """Record a newly started workflow as running"""
+        # Two starts in the same second share an id; the newer one replaces it
+        previous = self.workflows.get(workflow_id)
+        if previous is not None:
+            self._workflows_by_status[previous['status']].discard(workflow_id)
+            for task_id in previous['pending_tasks']:
+                self._task_workflows.pop(task_id, None)
+        
         self.workflows[workflow_id] = {
-            'name': 'emergency_analysis',
+            'name': name,
             'parameters': parameters,
-            'tasks': workflow_tasks,
+            'tasks': tasks,
+            'pending_tasks': {task_id for _, task_id in tasks},
+            'task_results': {},  # task id -> 'completed' or 'failed'
             'status': 'running',
-            'started_at': datetime.now().isoformat()
+            'started_at': time.time()
         }
+        self._workflows_by_status['running'].add(workflow_id)
+        for _, task_id in tasks:
+            self._task_workflows[task_id] = workflow_id
+        self._invalidate_status_cache()
+        
+        # Nothing to wait for when no agent took part
+        if not tasks:
+            self._mark_workflow_done(workflow_id)
+    
+    def _set_workflow_status(self, workflow_id: str, status: str):
+        """Change a workflow's status, keeping the status index in step"""
+        workflow = self.workflows[workflow_id]
+        self._workflows_by_status[workflow['status']].discard(workflow_id)
+        self._workflows_by_status[status].add(workflow_id)
+        workflow['status'] = status
+    
+    def _mark_workflow_done(self, workflow_id: str, status: str = 'completed'):
+        """Move a running workflow to a terminal status"""
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None or workflow['status'] != 'running':
+            return
         
-        return workflow_id
+        self._set_workflow_status(workflow_id, status)
+        workflow['finished_at'] = time.time()
+        self._invalidate_status_cache()
     
     def get_workflow_status(self, workflow_id: str) -> Dict[str, Any]:
         """Get status of a specific workflow"""
@@ -423,56 +614,90 @@ class AgentCoordinator:
         
         workflow = self.workflows[workflow_id]
         
-        # Check task statuses
-        task_statuses = {}
-        for task_type, task_id in workflow['tasks']:
-            # This would need to be implemented to check actual task status
-            task_statuses[task_type] = 'unknown'  # Placeholder
+        # Tasks without a task_finished message yet are still queued or running
+        task_statuses = {
+            task_type: workflow['task_results'].get(task_id, 'pending')
+            for task_type, task_id in workflow['tasks']
+        }
+        finished_at = workflow.get('finished_at')
         
         return {
             'workflow_id': workflow_id,
             'name': workflow['name'],
             'status': workflow['status'],
-            'started_at': workflow['started_at'],
+            'started_at': datetime.fromtimestamp(workflow['started_at']).isoformat(),
+            'finished_at': datetime.fromtimestamp(finished_at).isoformat() if finished_at else None,
             'task_statuses': task_statuses,
             'parameters': workflow['parameters']
         }
     
-    def get_system_status(self) -> Dict[str, Any]:
-        """Get overall system status"""
-        agent_statuses = {}
-        for agent_name, agent in self.agents.items():
-            agent_statuses[agent_name] = agent.get_status()
+    def _collect_from_agents(self, probe) -> Dict[str, Any]:
+        """Call probe(agent) for every agent concurrently, keyed by agent name"""
+        if len(self.agents) <= 1:
+            # Nothing to overlap; skip the pool
+            return {name: probe(agent) for name, agent in self.agents.items()}
+        
+        names = list(self.agents)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            results = executor.map(lambda name: probe(self.agents[name]), names)
+            return dict(zip(names, results))
+    
+    def _now_iso(self) -> str:
+        """Current timestamp, formatted at most once a second"""
+        tick = time.monotonic()
+        if tick >= self._iso_expires_at:
+            self._iso_str = datetime.now().isoformat()
+            self._iso_expires_at = tick + 1.0
+        return self._iso_str
+    
+    def _invalidate_status_cache(self):
+        """Drop cached status/health snapshots after a lifecycle or workflow change"""
+        self._status_cache = (0.0, None)
+        self._health_cache = (0.0, None)
+    
+    def get_system_status(self, force: bool = False) -> Dict[str, Any]:
+        """Get overall system status, reusing a snapshot younger than status_cache_ttl"""
+        now = time.monotonic()
+        cached_at, cached = self._status_cache
+        if not force and cached is not None and now - cached_at < self.status_cache_ttl:
+            # Callers get their own copy so they can't alter the shared snapshot
+            return copy.deepcopy(cached)
         
-        return {
+        agent_statuses = self._collect_from_agents(lambda agent: agent.get_status())
+        
+        result = {
             'system_status': self.system_status,
             'scheduler_active': self.scheduler_active,
             'total_agents': len(self.agents),
-            'active_workflows': len([w for w in self.workflows.values() if w['status'] == 'running']),
+            'active_workflows': len(self._workflows_by_status['running']),
             'total_workflows': len(self.workflows),
             'agents': agent_statuses,
             'message_queue_size': len(self.message_queue),
-            'timestamp': datetime.now().isoformat()
+            'message_queue_limit': self.message_queue.maxlen,
+            'timestamp': self._now_iso()
         }
+        self._status_cache = (now, result)
+        return copy.deepcopy(result)
     
-    def get_system_health(self) -> Dict[str, Any]:
-        """Get system health status"""
-        agent_health = {}
-        overall_healthy = True
+    def get_system_health(self, force: bool = False) -> Dict[str, Any]:
+        """Get system health status, reusing a snapshot younger than status_cache_ttl"""
+        now = time.monotonic()
+        cached_at, cached = self._health_cache
+        if not force and cached is not None and now - cached_at < self.status_cache_ttl:
+            return copy.deepcopy(cached)
         
-        for agent_name, agent in self.agents.items():
-            health = agent.health_check()
-            agent_health[agent_name] = health
-            if not health.get('healthy', False):
-                overall_healthy = False
+        agent_health = self._collect_from_agents(lambda agent: agent.health_check())
+        overall_healthy = all(health.get('healthy', False) for health in agent_health.values())
         
-        return {
+        result = {
             'overall_healthy': overall_healthy,
             'system_status': self.system_status,
             'agents': agent_health,
             'scheduler_active': self.scheduler_active,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': self._now_iso()
         }
+        self._health_cache = (now, result)
+        return copy.deepcopy(result)
     
     def restart_agent(self, agent_name: str):
         """Restart a specific agent"""
@@ -481,7 +706,7 @@ class AgentCoordinator:
         
         agent = self.agents[agent_name]
         
-        self.logger.info(f"Restarting agent: {agent_name}")
+        self.logger.info("Restarting agent: %s", agent_name)
         
         # Stop the agent
         agent.stop()
@@ -491,8 +716,9 @@ class AgentCoordinator:
         
         # Start the agent
         agent.start()
+        self._invalidate_status_cache()
         
-        self.logger.info(f"Agent {agent_name} restarted")
+        self.logger.info("Agent %s restarted", agent_name)
     
     def get_agent_logs(self, agent_name: str, lines: int = 100) -> List[str]:
         """Get recent logs from a specific agent"""
@@ -504,10 +730,12 @@ class AgentCoordinator:
 def main():
     """Main function for running the agent coordinator"""
     import argparse
+    import signal
     
     parser = argparse.ArgumentParser(description='Multi-Market Correlation Engine Agent Coordinator')
     parser.add_argument('--config', type=str, help='Configuration file path')
-    parser.add_argument('--workflow', type=str, help='Workflow to execute')
+    parser.add_argument('--workflow', type=str, choices=AgentCoordinator.available_workflows(),
+                        help='Workflow to execute')
     parser.add_argument('--symbols', nargs='+', help='Symbols to analyze')
     parser.add_argument('--test-mode', action='store_true', help='Run in test mode')
     
@@ -517,8 +745,8 @@ def main():
     config = {}
     if args.config:
         try:
-            with open(args.config, 'r') as f:
-                config = json.load(f)
+            with open(args.config, 'rb') as f:
+                config = _loads(f.read())
         except Exception as e:
             print(f"Error loading config: {e}")
     
@@ -529,6 +757,11 @@ def main():
     # Initialize coordinator
     coordinator = AgentCoordinator(config)
     
+    # Ctrl+C and SIGTERM wake the main loop immediately
+    stop_evt = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_evt.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_evt.set())
+    
     try:
         # Start the system
         coordinator.start_system()
@@ -545,18 +778,18 @@ def main():
         if args.test_mode:
             # Run for a short time in test mode
             print("Running in test mode for 60 seconds...")
-            time.sleep(60)
+            stop_evt.wait(timeout=60)
         else:
-            # Run indefinitely
+            # Run until signalled, printing status every 10 seconds
             print("Agent system running. Press Ctrl+C to stop.")
-            while True:
-                time.sleep(10)
-                
-                # Print periodic status
+            while not stop_evt.wait(timeout=10):
                 status = coordinator.get_system_status()
                 print(f"System Status: {status['system_status']}, "
                       f"Active Agents: {status['total_agents']}, "
                       f"Active Workflows: {status['active_workflows']}")
+        
+        if stop_evt.is_set():
+            print("\nShutting down...")
     
     except KeyboardInterrupt:
         print("\nShutting down...")
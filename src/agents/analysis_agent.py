@@ -10,20 +10,112 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
+import logging
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import json
+import math
+import multiprocessing
 import threading
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import cached_property
 
 from .base_agent import BaseAgent, Task, TaskPriority, AgentStatus
-from ..data.database_manager import DatabaseManager
-from ..models.correlation_engine import CorrelationEngine
-from ..models.garch_models import GARCHAnalyzer
-from ..models.var_models import VARAnalyzer
-from ..models.ml_models import MLCorrelationPredictor, RegimeDetector
-from ..models.network_analysis import NetworkAnalyzer
+from ..models._corr_kernels import rolling_pearson_matrix
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _nan_to_none(obj: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson writes them as null"""
+    if isinstance(obj, float):
+        return None if math.isnan(obj) or math.isinf(obj) else obj
+    if isinstance(obj, dict):
+        return {key: _nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_nan_to_none(value) for value in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Fallback conversion for values the JSON encoder can't handle natively"""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return _nan_to_none(obj.to_dict())
+    if hasattr(obj, 'tolist'):  # NumPy arrays and scalars
+        return _nan_to_none(obj.tolist())
+    if hasattr(obj, 'isoformat'):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_results(obj: Any) -> str:
+    """Serialize analysis results to a JSON string, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    # Plain json would write bare NaN, which is not valid JSON
+    return json.dumps(_nan_to_none(obj), default=_json_default, allow_nan=False)
+
+
+def _summarize_garch(analyzer, series: pd.Series, horizon: int) -> Dict[str, Any]:
+    """Fit a GARCH model to one symbol's series and forecast its volatility"""
+    model_results = analyzer.fit_garch_model(series)
+    forecasts = analyzer.forecast_volatility(series, horizon=horizon)
+    
+    return {
+        'current_volatility': model_results.get('current_volatility', 0),
+        'forecasts': forecasts,
+        'model_info': {
+            'aic': model_results.get('aic', 0),
+            'bic': model_results.get('bic', 0)
+        }
+    }
+
+
+# One analyzer per worker process, built on its first task
+_worker_garch_analyzer = None
+
+
+def _fit_one_symbol(task: Tuple[str, pd.Series, int]) -> Tuple[str, Dict[str, Any]]:
+    """Process-pool entry point: (symbol, series, horizon) -> (symbol, summary)"""
+    global _worker_garch_analyzer
+    if _worker_garch_analyzer is None:
+        from ..models.garch_models import GARCHAnalyzer
+        _worker_garch_analyzer = GARCHAnalyzer()
+    
+    symbol, series, horizon = task
+    return symbol, _summarize_garch(_worker_garch_analyzer, series, horizon)
+
+
+# Long-lived GARCH worker pool. Workers come from a fork server (spawn where
+# that is unavailable) rather than fork(), since the agent process is already
+# running threads whose held locks a forked child would inherit
+_GARCH_POOL = None
+_GARCH_POOL_LOCK = threading.Lock()
+
+
+def _get_garch_pool() -> ProcessPoolExecutor:
+    """Get the shared GARCH process pool, creating it on first use"""
+    global _GARCH_POOL
+    with _GARCH_POOL_LOCK:
+        if _GARCH_POOL is None:
+            method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _GARCH_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return _GARCH_POOL
 
 
 class AnalysisAgent(BaseAgent):
@@ -40,6 +132,16 @@ class AnalysisAgent(BaseAgent):
     - Automated alerts and reporting
     """
     
+    # Analysis type -> lazily built component it relies on
+    _COMPONENTS = {
+        'correlation_analysis': 'correlation_engine',
+        'volatility_analysis': 'garch_analyzer',
+        'var_analysis': 'var_analyzer',
+        'ml_prediction': 'ml_predictor',
+        'regime_detection': 'regime_detector',
+        'network_analysis': 'network_analyzer',
+    }
+    
     def __init__(self, agent_id: str = "analysis-agent-001", 
                  name: str = "Analysis Agent", 
                  config: Optional[Dict] = None):
@@ -72,64 +174,129 @@ class AnalysisAgent(BaseAgent):
         
         super().__init__(agent_id, name, default_config)
         
-        # Initialize components
-        self.db_manager = DatabaseManager()
-        self.correlation_engine = CorrelationEngine()
-        self.garch_analyzer = GARCHAnalyzer()
-        self.var_analyzer = VARAnalyzer()
-        self.ml_predictor = MLCorrelationPredictor()
-        self.regime_detector = RegimeDetector()
-        self.network_analyzer = NetworkAnalyzer()
+        # Resolve thresholds and feature flags once instead of per check
+        thresholds = default_config['alert_thresholds']
+        self._thr_corr = float(thresholds['high_correlation'])
+        self._thr_vol = float(thresholds['high_volatility'])
+        self._thr_regime = float(thresholds['regime_change'])
+        # Reporting cut-offs: significant pairs and high-volatility symbols
+        self._thr_sig_corr = float(default_config['correlation_threshold'])
+        self._thr_summary_vol = float(default_config['volatility_threshold'])
+        self._ml_enabled = bool(default_config['enable_ml_predictions'])
+        self._regime_enabled = bool(default_config['enable_regime_detection'])
+        self._network_enabled = bool(default_config['enable_network_analysis'])
         
         # Analysis state
         self.last_analysis_time = None
         self.analysis_results = {}
         self.alerts = []
+        self._alert_ts: List[float] = []  # Epoch time of each alert, same order
+        # Guards alerts/_alert_ts while comprehensive sub-analyses run in parallel
+        self._state_lock = threading.Lock()
         self.model_cache = {}
         
+        # Task type -> handler taking the task data dict
+        self._dispatch = {
+            'correlation_analysis': self._perform_correlation_analysis,
+            'volatility_analysis': self._perform_volatility_analysis,
+            'var_analysis': self._perform_var_analysis,
+            'ml_prediction': self._perform_ml_prediction,
+            'regime_detection': self._perform_regime_detection,
+            'network_analysis': self._perform_network_analysis,
+            'comprehensive_analysis': self._perform_comprehensive_analysis,
+            'alert_check': self._check_alerts,
+        }
+        
         self.logger.info("Analysis Agent initialized")
     
+    # Components are built on first use, so their model stacks (arch,
+    # statsmodels, sklearn, networkx) only load for analyses that run
+    
+    @cached_property
+    def db_manager(self):
+        """Database access for market data"""
+        from ..data.database_manager import DatabaseManager
+        return DatabaseManager()
+    
+    @cached_property
+    def correlation_engine(self):
+        """Static correlation matrix engine"""
+        from ..models.correlation_engine import CorrelationEngine
+        return CorrelationEngine()
+    
+    @cached_property
+    def garch_analyzer(self):
+        """GARCH volatility models"""
+        from ..models.garch_models import GARCHAnalyzer
+        return GARCHAnalyzer()
+    
+    @cached_property
+    def var_analyzer(self):
+        """VAR models and Granger causality tests"""
+        from ..models.var_models import VARAnalyzer
+        return VARAnalyzer()
+    
+    @cached_property
+    def ml_predictor(self):
+        """ML correlation predictor"""
+        from ..models.ml_models import MLCorrelationPredictor
+        return MLCorrelationPredictor()
+    
+    @cached_property
+    def regime_detector(self):
+        """Market regime detector"""
+        from ..models.ml_models import RegimeDetector
+        return RegimeDetector()
+    
+    @cached_property
+    def network_analyzer(self):
+        """Correlation network analyzer"""
+        from ..models.network_analysis import NetworkAnalyzer
+        return NetworkAnalyzer()
+    
+    def _build_components(self, names: List[str]):
+        """
+        Build lazy components before analyses that use them run in parallel.
+        
+        cached_property takes no lock, so threads reaching a component for the
+        first time at once would each build their own instance. A component
+        that fails to build is left for its analysis to retry and report.
+        """
+        for name in names:
+            try:
+                getattr(self, name)
+            except Exception as e:
+                self.logger.debug(f"Deferred building {name}: {e}")
+    
     def execute_task(self, task: Task) -> Any:
         """Execute an analysis task"""
         task_type = task.data.get('type', 'unknown')
         
         try:
-            if task_type == 'correlation_analysis':
-                return self._perform_correlation_analysis(task.data)
-            elif task_type == 'volatility_analysis':
-                return self._perform_volatility_analysis(task.data)
-            elif task_type == 'var_analysis':
-                return self._perform_var_analysis(task.data)
-            elif task_type == 'ml_prediction':
-                return self._perform_ml_prediction(task.data)
-            elif task_type == 'regime_detection':
-                return self._perform_regime_detection(task.data)
-            elif task_type == 'network_analysis':
-                return self._perform_network_analysis(task.data)
-            elif task_type == 'comprehensive_analysis':
-                return self._perform_comprehensive_analysis(task.data)
-            elif task_type == 'alert_check':
-                return self._check_alerts(task.data)
-            else:
+            handler = self._dispatch.get(task_type)
+            if handler is None:
                 raise ValueError(f"Unknown task type: {task_type}")
+            return handler(task.data)
                 
         except Exception as e:
             self.logger.error(f"Analysis task execution failed: {e}")
             raise
     
-    def _get_market_data(self, symbols: List[str], period_days: int = None) -> pd.DataFrame:
+    def _get_market_data(self, symbols: List[str], period_days: int = None,
+                         now: Optional[datetime] = None) -> pd.DataFrame:
         """Get market data for analysis"""
         period_days = period_days or self.config['lookback_period']
+        now = now or datetime.now()
         
         try:
             # Get data from database
             data = self.db_manager.get_market_data(
                 symbols=symbols,
-                start_date=datetime.now() - timedelta(days=period_days),
-                end_date=datetime.now()
+                start_date=now - timedelta(days=period_days),
+                end_date=now
             )
             
-            if data is None or data.empty:
+            if data is None or data.shape[0] == 0:
                 self.logger.warning(f"No data found for symbols: {symbols}")
                 return pd.DataFrame()
             
@@ -147,76 +314,86 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing correlation analysis for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
             
-            if data.empty:
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
+            
+            if data.shape[0] == 0:
                 return {'error': 'No data available for analysis'}
             
-            # Calculate correlations
-            correlations = self.correlation_engine.calculate_rolling_correlations(
-                data, window=window
+            # Calculate rolling correlations; gaps are handled per pair, so a
+            # sparse symbol doesn't blank out the windows of the others
+            prices = data.select_dtypes(include=[np.number])
+            rolling_correlations = rolling_pearson_matrix(
+                np.ascontiguousarray(prices.to_numpy(dtype=np.float64)), window
             )
+            latest_window = {}
+            if len(rolling_correlations):
+                cols = prices.columns
+                iu, ju = np.triu_indices(len(cols), k=1)
+                latest = rolling_correlations[-1][iu, ju]
+                latest_window = {
+                    f"{cols[i]}-{cols[j]}": float(v)
+                    for i, j, v in zip(iu, ju, latest) if not np.isnan(v)
+                }
             
             # Calculate correlation matrix
             correlation_matrix, p_values = self.correlation_engine.calculate_correlation_matrix(data)
             
             # Extract correlation statistics from the matrix
             correlation_stats = {}
+            matrix_dict = {}
             if correlation_matrix is not None:
                 # Handle both DataFrame and dict cases
-                import numpy as np
-                import pandas as pd
-                
                 if isinstance(correlation_matrix, pd.DataFrame) and not correlation_matrix.empty:
-                    # Get upper triangle of correlation matrix (excluding diagonal)
-                    mask = np.triu(np.ones_like(correlation_matrix, dtype=bool), k=1)
-                    correlations_upper = correlation_matrix.where(mask)
+                    cols = correlation_matrix.columns.to_numpy()
+                    arr = correlation_matrix.to_numpy()
+                    
+                    # Column labels plus row-major values; the matrix is only
+                    # carried for transport, so skip the nested to_dict()
+                    matrix_dict = {'columns': cols.tolist(), 'values': arr.tolist()}
                     
-                    # Convert to dictionary format
-                    for i in range(len(correlation_matrix.columns)):
-                        for j in range(i+1, len(correlation_matrix.columns)):
-                            col_i = correlation_matrix.columns[i]
-                            col_j = correlation_matrix.columns[j]
-                            corr_value = correlation_matrix.iloc[i, j]
-                            if not np.isnan(corr_value):
-                                correlation_stats[f"{col_i}-{col_j}"] = corr_value
+                    # Upper triangle of the correlation matrix (excluding diagonal)
+                    iu, ju = np.triu_indices(len(cols), k=1)
+                    vals = arr[iu, ju]
+                    ok = ~np.isnan(vals)
+                    pairs = [f"{cols[i]}-{cols[j]}" for i, j in zip(iu[ok], ju[ok])]
+                    correlation_stats = dict(zip(pairs, vals[ok].tolist()))
                 elif isinstance(correlation_matrix, dict):
                     # If already a dict, use it directly
                     correlation_stats = correlation_matrix
-            
-            # Identify significant correlations
-            significant_pairs = []
-            threshold = self.config['correlation_threshold']
-            
-            for pair, corr_value in correlation_stats.items():
-                if abs(corr_value) >= threshold:
-                    significant_pairs.append({
-                        'pair': pair,
-                        'correlation': corr_value,
-                        'strength': 'strong' if abs(corr_value) >= 0.8 else 'moderate'
-                    })
-            
-            # Handle correlation matrix format
-            matrix_dict = {}
-            if correlation_matrix is not None:
-                if isinstance(correlation_matrix, pd.DataFrame):
-                    if not correlation_matrix.empty:
-                        matrix_dict = correlation_matrix.to_dict()
-                elif isinstance(correlation_matrix, dict):
                     matrix_dict = correlation_matrix
             
+            # Identify significant correlations with one vectorized threshold
+            pair_names = list(correlation_stats)
+            pair_values = np.asarray(list(correlation_stats.values()), dtype=np.float64)
+            abs_values = np.abs(pair_values)
+            selected = np.flatnonzero(abs_values >= self._thr_sig_corr)
+            
+            significant_pairs = [
+                {
+                    'pair': pair_names[k],
+                    'correlation': float(pair_values[k]),
+                    'strength': 'strong' if abs_values[k] >= 0.8 else 'moderate'
+                }
+                for k in selected
+            ]
+            
             results = {
                 'symbols': symbols,
                 'window': window,
                 'correlation_matrix': matrix_dict,
                 'correlation_stats': correlation_stats,
                 'significant_pairs': significant_pairs,
-                'analysis_timestamp': datetime.now().isoformat()
+                'latest_window_correlations': latest_window,
+                'analysis_timestamp': now.isoformat()
             }
             
             # Check for alerts
-            self._check_correlation_alerts(significant_pairs)
+            self._check_correlation_alerts(significant_pairs, out=task_data.get('alerts_out'))
             
             # Store results
             self.analysis_results['correlation'] = results
@@ -235,47 +412,42 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing volatility analysis for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
             
-            if data.empty:
-                return {'error': 'No data available for analysis'}
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
             
-            volatility_results = {}
+            if data.shape[0] == 0:
+                return {'error': 'No data available for analysis'}
             
+            tasks = []
             for symbol in symbols:
                 if symbol in data.columns:
                     symbol_data = data[symbol].dropna()
-                    
-                    if len(symbol_data) < 100:  # Minimum data requirement
-                        continue
-                    
-                    # Fit GARCH model
-                    model_results = self.garch_analyzer.fit_garch_model(symbol_data)
-                    
-                    # Generate forecasts
-                    forecasts = self.garch_analyzer.forecast_volatility(
-                        symbol_data, horizon=forecast_horizon
-                    )
-                    
-                    volatility_results[symbol] = {
-                        'current_volatility': model_results.get('current_volatility', 0),
-                        'forecasts': forecasts,
-                        'model_info': {
-                            'aic': model_results.get('aic', 0),
-                            'bic': model_results.get('bic', 0)
-                        }
-                    }
+                    if len(symbol_data) >= 100:  # Minimum data requirement
+                        tasks.append((symbol, symbol_data, forecast_horizon))
+            
+            # GARCH fits are independent and optimizer-bound, so spread them
+            # over the shared worker processes; a single fit isn't worth the hop
+            if len(tasks) > 1:
+                volatility_results = dict(_get_garch_pool().map(_fit_one_symbol, tasks))
+            else:
+                volatility_results = {
+                    symbol: _summarize_garch(self.garch_analyzer, symbol_data, horizon)
+                    for symbol, symbol_data, horizon in tasks
+                }
             
             results = {
                 'symbols': symbols,
                 'forecast_horizon': forecast_horizon,
                 'volatility_analysis': volatility_results,
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': now.isoformat()
             }
             
             # Check for volatility alerts
-            self._check_volatility_alerts(volatility_results)
+            self._check_volatility_alerts(volatility_results, out=task_data.get('alerts_out'))
             
             # Store results
             self.analysis_results['volatility'] = results
@@ -294,30 +466,46 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing VAR analysis for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
+            
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
             
-            if data.empty:
+            if data.shape[0] == 0:
                 return {'error': 'No data available for analysis'}
             
             # Prepare data for VAR
             var_data = data[symbols].dropna()
             
-            if len(var_data) < 100:
+            if var_data.shape[0] < 100:
                 return {'error': 'Insufficient data for VAR analysis'}
             
             # Fit VAR model
             var_results = self.var_analyzer.fit_var_model(var_data, max_lags=max_lags)
             
-            # Perform Granger causality tests
+            # Perform Granger causality tests; the fits are independent and
+            # spend their time in GIL-releasing linear algebra
+            pairs = [
+                (symbol1, symbol2)
+                for i, symbol1 in enumerate(symbols)
+                for j, symbol2 in enumerate(symbols)
+                if i != j
+            ]
             causality_results = {}
-            for i, symbol1 in enumerate(symbols):
-                for j, symbol2 in enumerate(symbols):
-                    if i != j:
-                        causality = self.var_analyzer.granger_causality_test(
-                            var_data, symbol1, symbol2
+            if pairs:
+                with ThreadPoolExecutor(max_workers=min(len(pairs), os.cpu_count() or 1)) as executor:
+                    futures = {
+                        (symbol1, symbol2): executor.submit(
+                            self.var_analyzer.granger_causality_test, var_data, symbol1, symbol2
                         )
-                        causality_results[f"{symbol1}_causes_{symbol2}"] = causality
+                        for symbol1, symbol2 in pairs
+                    }
+                    causality_results = {
+                        f"{symbol1}_causes_{symbol2}": future.result()
+                        for (symbol1, symbol2), future in futures.items()
+                    }
             
             results = {
                 'symbols': symbols,
@@ -325,7 +513,7 @@ class AnalysisAgent(BaseAgent):
                 'optimal_lags': var_results.get('optimal_lags', 1),
                 'model_summary': var_results.get('summary', {}),
                 'causality_tests': causality_results,
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': now.isoformat()
             }
             
             # Store results
@@ -339,7 +527,7 @@ class AnalysisAgent(BaseAgent):
     
     def _perform_ml_prediction(self, task_data: Dict) -> Dict[str, Any]:
         """Perform machine learning predictions"""
-        if not self.config['enable_ml_predictions']:
+        if not self._ml_enabled:
             return {'message': 'ML predictions disabled in config'}
         
         symbols = task_data.get('symbols', self.config['symbols'])
@@ -348,10 +536,14 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing ML predictions for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
             
-            if data.empty:
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
+            
+            if data.shape[0] == 0:
                 return {'error': 'No data available for analysis'}
             
             # Train/update ML models
@@ -365,7 +557,7 @@ class AnalysisAgent(BaseAgent):
                 'prediction_horizon': prediction_horizon,
                 'model_performance': training_results,
                 'predictions': predictions,
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': now.isoformat()
             }
             
             # Store results
@@ -379,7 +571,7 @@ class AnalysisAgent(BaseAgent):
     
     def _perform_regime_detection(self, task_data: Dict) -> Dict[str, Any]:
         """Perform market regime detection"""
-        if not self.config['enable_regime_detection']:
+        if not self._regime_enabled:
             return {'message': 'Regime detection disabled in config'}
         
         symbols = task_data.get('symbols', self.config['symbols'])
@@ -388,10 +580,14 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing regime detection for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
+            
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
             
-            if data.empty:
+            if data.shape[0] == 0:
                 return {'error': 'No data available for analysis'}
             
             # Detect regimes
@@ -407,11 +603,11 @@ class AnalysisAgent(BaseAgent):
                 'current_regime': current_regime,
                 'regime_probabilities': regime_probabilities,
                 'regime_characteristics': regime_results.get('regime_stats', {}),
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': now.isoformat()
             }
             
             # Check for regime change alerts
-            self._check_regime_alerts(results)
+            self._check_regime_alerts(results, out=task_data.get('alerts_out'))
             
             # Store results
             self.analysis_results['regime_detection'] = results
@@ -424,7 +620,7 @@ class AnalysisAgent(BaseAgent):
     
     def _perform_network_analysis(self, task_data: Dict) -> Dict[str, Any]:
         """Perform network analysis"""
-        if not self.config['enable_network_analysis']:
+        if not self._network_enabled:
             return {'message': 'Network analysis disabled in config'}
         
         symbols = task_data.get('symbols', self.config['symbols'])
@@ -433,10 +629,14 @@ class AnalysisAgent(BaseAgent):
         self.logger.info(f"Performing network analysis for {len(symbols)} symbols")
         
         try:
-            # Get market data
-            data = self._get_market_data(symbols)
+            now = datetime.now()
+            
+            # Get market data, unless the caller already fetched it
+            data = task_data.get('data')
+            if data is None:
+                data = self._get_market_data(symbols, now=now)
             
-            if data.empty:
+            if data.shape[0] == 0:
                 return {'error': 'No data available for analysis'}
             
             # Build correlation network
@@ -461,7 +661,7 @@ class AnalysisAgent(BaseAgent):
                 'systemic_risk_nodes': systemic_risk,
                 'edge_count': network_results.get('edge_count', 0),
                 'density': network_results.get('density', 0),
-                'analysis_timestamp': datetime.now().isoformat()
+                'analysis_timestamp': now.isoformat()
             }
             
             # Store results
@@ -481,51 +681,73 @@ class AnalysisAgent(BaseAgent):
         
         comprehensive_results = {}
         
+        # Fetch once and hand the same frame to every analysis; on failure each
+        # analysis falls back to its own fetch and reports its own error
+        try:
+            data = self._get_market_data(symbols)
+        except Exception:
+            data = None
+        
+        # Alerts raised by the sub-analyses are collected here and recorded
+        # in one batch once they have all finished
+        pending_alerts = []
+        shared = {'data': data, 'alerts_out': pending_alerts}
+        
         # Run all analysis types
         analysis_types = [
-            ('correlation_analysis', {'symbols': symbols}),
-            ('volatility_analysis', {'symbols': symbols}),
-            ('var_analysis', {'symbols': symbols[:3]}),  # Limit for performance
+            ('correlation_analysis', {'symbols': symbols, **shared}),
+            ('volatility_analysis', {'symbols': symbols, **shared}),
+            ('var_analysis', {'symbols': symbols[:3], **shared}),  # Limit for performance
         ]
         
-        if self.config['enable_ml_predictions']:
-            analysis_types.append(('ml_prediction', {'symbols': symbols}))
+        if self._ml_enabled:
+            analysis_types.append(('ml_prediction', {'symbols': symbols, **shared}))
         
-        if self.config['enable_regime_detection']:
-            analysis_types.append(('regime_detection', {'symbols': symbols}))
+        if self._regime_enabled:
+            analysis_types.append(('regime_detection', {'symbols': symbols, **shared}))
         
-        if self.config['enable_network_analysis']:
-            analysis_types.append(('network_analysis', {'symbols': symbols}))
+        if self._network_enabled:
+            analysis_types.append(('network_analysis', {'symbols': symbols, **shared}))
         
-        for analysis_type, analysis_data in analysis_types:
-            try:
-                task = Task(
-                    id=f"comp_{analysis_type}",
-                    name=f"Comprehensive {analysis_type}",
-                    priority=TaskPriority.MEDIUM,
-                    created_at=datetime.now(),
-                    scheduled_at=datetime.now(),
-                    data={'type': analysis_type, **analysis_data}
-                )
-                
-                result = self.execute_task(task)
-                comprehensive_results[analysis_type] = result
-                
-            except Exception as e:
-                self.logger.error(f"Failed to run {analysis_type}: {e}")
-                comprehensive_results[analysis_type] = {'error': str(e)}
+        self._build_components(['db_manager'] + [
+            self._COMPONENTS[analysis_type] for analysis_type, _ in analysis_types
+        ])
+        
+        # The analyses are independent once the data is fetched, and their
+        # heavy lifting happens in GIL-releasing native code
+        with ThreadPoolExecutor(max_workers=len(analysis_types)) as executor:
+            futures = {
+                executor.submit(self._dispatch[analysis_type], analysis_data): analysis_type
+                for analysis_type, analysis_data in analysis_types
+            }
+            for future in as_completed(futures):
+                analysis_type = futures[future]
+                try:
+                    comprehensive_results[analysis_type] = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to run {analysis_type}: {e}")
+                    comprehensive_results[analysis_type] = {'error': str(e)}
+        
+        # Report in the configured order rather than completion order
+        comprehensive_results = {
+            analysis_type: comprehensive_results[analysis_type]
+            for analysis_type, _ in analysis_types
+        }
+        
+        self._flush_alerts(pending_alerts)
         
         # Generate summary
         summary = self._generate_analysis_summary(comprehensive_results)
+        finished_at = datetime.now()
         
         results = {
             'symbols': symbols,
             'analysis_results': comprehensive_results,
             'summary': summary,
-            'analysis_timestamp': datetime.now().isoformat()
+            'analysis_timestamp': finished_at.isoformat()
         }
         
-        self.last_analysis_time = datetime.now()
+        self.last_analysis_time = finished_at
         
         # Send completion message
         self.send_message(
@@ -556,11 +778,13 @@ class AnalysisAgent(BaseAgent):
                 )
         
         if 'volatility_analysis' in results and 'error' not in results['volatility_analysis']:
-            vol_result = results['volatility_analysis']
-            high_vol_symbols = [
-                symbol for symbol, data in vol_result.get('volatility_analysis', {}).items()
-                if data.get('current_volatility', 0) > self.config['volatility_threshold']
-            ]
+            vol_by_symbol = results['volatility_analysis'].get('volatility_analysis', {})
+            syms = np.array(list(vol_by_symbol), dtype=object)
+            vols = np.fromiter(
+                (data.get('current_volatility', 0.0) for data in vol_by_symbol.values()),
+                dtype=np.float64, count=len(syms)
+            )
+            high_vol_symbols = syms[vols > self._thr_summary_vol].tolist()
             if high_vol_symbols:
                 summary['key_findings'].append(
                     f"High volatility detected in: {', '.join(high_vol_symbols)}"
@@ -573,40 +797,70 @@ class AnalysisAgent(BaseAgent):
         
         return summary
     
-    def _check_correlation_alerts(self, significant_pairs: List[Dict]):
+    def _emit_alert(self, alert: Dict[str, Any], now: datetime, level: int,
+                    out: Optional[list] = None):
+        """
+        Record and log an alert, or defer it into out for a batched flush.
+        
+        Deferred entries are (epoch, alert, log level) tuples; see
+        _flush_alerts.
+        """
+        if out is not None:
+            out.append((now.timestamp(), alert, level))
+            return
+        
+        with self._state_lock:
+            self.alerts.append(alert)
+            self._alert_ts.append(now.timestamp())
+        self.logger.log(level, alert['message'])
+    
+    def _flush_alerts(self, pending: list):
+        """Record deferred alerts under one lock acquisition, oldest first"""
+        if not pending:
+            return
+        
+        pending.sort(key=lambda entry: entry[0])
+        with self._state_lock:
+            self.alerts.extend(alert for _, alert, _ in pending)
+            self._alert_ts.extend(ts for ts, _, _ in pending)
+        
+        for _, alert, level in pending:
+            self.logger.log(level, alert['message'])
+    
+    def _check_correlation_alerts(self, significant_pairs: List[Dict], out: Optional[list] = None):
         """Check for correlation-based alerts"""
-        threshold = self.config['alert_thresholds']['high_correlation']
+        threshold = self._thr_corr
         
         for pair_info in significant_pairs:
             if abs(pair_info['correlation']) >= threshold:
+                now = datetime.now()
                 alert = {
                     'type': 'high_correlation',
                     'message': f"High correlation detected: {pair_info['pair']} ({pair_info['correlation']:.3f})",
                     'severity': 'high' if abs(pair_info['correlation']) >= 0.9 else 'medium',
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'data': pair_info
                 }
-                self.alerts.append(alert)
-                self.logger.warning(alert['message'])
+                self._emit_alert(alert, now, logging.WARNING, out)
     
-    def _check_volatility_alerts(self, volatility_results: Dict):
+    def _check_volatility_alerts(self, volatility_results: Dict, out: Optional[list] = None):
         """Check for volatility-based alerts"""
-        threshold = self.config['alert_thresholds']['high_volatility']
+        threshold = self._thr_vol
         
         for symbol, vol_data in volatility_results.items():
             current_vol = vol_data.get('current_volatility', 0)
             if current_vol >= threshold:
+                now = datetime.now()
                 alert = {
                     'type': 'high_volatility',
                     'message': f"High volatility detected in {symbol}: {current_vol:.3f}",
                     'severity': 'high' if current_vol >= threshold * 2 else 'medium',
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'data': {'symbol': symbol, 'volatility': current_vol}
                 }
-                self.alerts.append(alert)
-                self.logger.warning(alert['message'])
+                self._emit_alert(alert, now, logging.WARNING, out)
     
-    def _check_regime_alerts(self, regime_results: Dict):
+    def _check_regime_alerts(self, regime_results: Dict, out: Optional[list] = None):
         """Check for regime change alerts"""
         # This is simplified - in practice, you'd compare with previous regime
         current_regime = regime_results.get('current_regime', 0)
@@ -615,40 +869,44 @@ class AnalysisAgent(BaseAgent):
         if probabilities and len(probabilities) > current_regime:
             regime_confidence = probabilities[current_regime]
             
-            if regime_confidence >= self.config['alert_thresholds']['regime_change']:
+            if regime_confidence >= self._thr_regime:
+                now = datetime.now()
                 alert = {
                     'type': 'regime_change',
                     'message': f"Strong regime signal detected: Regime {current_regime} (confidence: {regime_confidence:.3f})",
                     'severity': 'medium',
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': now.isoformat(),
                     'data': regime_results
                 }
-                self.alerts.append(alert)
-                self.logger.info(alert['message'])
+                self._emit_alert(alert, now, logging.INFO, out)
     
     def _check_alerts(self, task_data: Dict) -> Dict[str, Any]:
         """Check and process alerts"""
-        # Clean old alerts (older than 24 hours)
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        self.alerts = [
-            alert for alert in self.alerts
-            if datetime.fromisoformat(alert['timestamp']) > cutoff_time
-        ]
+        # Clean old alerts (older than 24 hours); alerts are appended in
+        # time order, so everything expired sits at the front
+        now = datetime.now()
+        cutoff = (now - timedelta(hours=24)).timestamp()
+        with self._state_lock:
+            expired = bisect_right(self._alert_ts, cutoff)
+            if expired:
+                del self.alerts[:expired]
+                del self._alert_ts[:expired]
         
         return {
             'total_alerts': len(self.alerts),
             'alerts_by_type': self._group_alerts_by_type(),
             'recent_alerts': self.alerts[-10:],  # Last 10 alerts
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
     
     def _group_alerts_by_type(self) -> Dict[str, int]:
         """Group alerts by type"""
-        alert_counts = {}
-        for alert in self.alerts:
-            alert_type = alert.get('type', 'unknown')
-            alert_counts[alert_type] = alert_counts.get(alert_type, 0) + 1
-        return alert_counts
+        return dict(Counter(alert.get('type', 'unknown') for alert in self.alerts))
+    
+    def dumps_results(self, analysis: Optional[str] = None) -> str:
+        """Get stored analysis results (all, or one key) serialized as a JSON string"""
+        results = self.analysis_results if analysis is None else self.analysis_results.get(analysis, {})
+        return _dumps_results(results)
     
     def get_analysis_status(self) -> Dict[str, Any]:
         """Get detailed analysis status"""
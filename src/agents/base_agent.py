@@ -260,6 +260,7 @@ class BaseAgent(ABC):
         """Execute a single task"""
         start_time = time.time()
         self.running_tasks[task.id] = task
+        succeeded = False
         
         try:
             self.logger.info(f"Executing task: {task.name}")
@@ -290,6 +291,7 @@ class BaseAgent(ABC):
                     self.logger.error(f"Error in task callback: {e}")
             
             self.logger.info(f"Task completed: {task.name} ({execution_time:.2f}s)")
+            succeeded = True
             
         except Exception as e:
             self.logger.error(f"Task failed: {task.name} - {e}")
@@ -299,6 +301,11 @@ class BaseAgent(ABC):
         finally:
             # Remove from running tasks
             self.running_tasks.pop(task.id, None)
+            
+            # Let the coordinator settle workflows waiting on this task
+            if self.subscribers:
+                self.send_message('coordinator', 'task_finished',
+                                  {'task_id': task.id, 'succeeded': succeeded})
     
     @abstractmethod
     def execute_task(self, task: Task) -> Any:
@@ -10,6 +10,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
+import asyncio
 import pandas as pd
 from datetime import datetime, timedelta, date
 from typing import Dict, List, Any, Optional
@@ -33,6 +34,15 @@ class DataCollectionAgent(BaseAgent):
     - Real-time and historical data collection
     """
     
+    # Asset class assigned to each symbol universe category
+    _CATEGORY_TO_CLASS = {
+        'global_indices': 'index',
+        'sector_etfs': 'etf',
+        'commodities': 'commodity',
+        'bonds': 'bond',
+        'currencies': 'currency'
+    }
+    
     def __init__(self, agent_id: str = "data-collector-001", 
                  name: str = "Data Collection Agent", 
                  config: Optional[Dict] = None):
@@ -51,7 +61,8 @@ class DataCollectionAgent(BaseAgent):
             'quality_threshold': 0.8,
             'retry_attempts': 3,
             'retry_delay': 60,
-            'batch_size': 10,
+            'batch_size': 50,
+            'max_concurrent_batches': 8,
             'enable_scheduling': True
         }
         
@@ -61,6 +72,7 @@ class DataCollectionAgent(BaseAgent):
         super().__init__(agent_id, name, default_config)
         
         # Update symbols with comprehensive list
+        self.asset_class_map: Dict[str, str] = {}
         try:
             comprehensive_symbols = self._get_comprehensive_symbol_list()
             self.config['symbols'] = comprehensive_symbols
@@ -132,14 +144,14 @@ class DataCollectionAgent(BaseAgent):
             end_date = date.today()
             start_date = end_date - timedelta(days=30)
             
-            # Collect data in batches
+            # Collect all batches concurrently; the collector's rate limiter paces requests
             batch_size = self.config['batch_size']
-            for i in range(0, len(symbols), batch_size):
-                batch_symbols = symbols[i:i + batch_size]
-                
-                # Collect data for this batch using collect_batch
-                batch_results = collector.collect_batch(batch_symbols, start_date, end_date)
-                
+            batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+            all_batch_results = asyncio.run(
+                self._collect_batches_concurrently(collector, batches, start_date, end_date)
+            )
+            
+            for batch_number, (batch_symbols, batch_results) in enumerate(zip(batches, all_batch_results), start=1):
                 # Process results
                 successful_results = [r for r in batch_results if r.success]
                 total_records = sum(r.records_collected for r in successful_results)
@@ -148,7 +160,7 @@ class DataCollectionAgent(BaseAgent):
                     # Calculate average quality score for this batch
                     avg_quality = sum(r.data_quality_score or 0 for r in successful_results) / len(successful_results)
                     
-                    results[f'batch_{i//batch_size + 1}'] = {
+                    results[f'batch_{batch_number}'] = {
                         'symbols': batch_symbols,
                         'successful_symbols': [r.symbol for r in successful_results],
                         'records_stored': total_records,
@@ -169,9 +181,6 @@ class DataCollectionAgent(BaseAgent):
                         'symbol': failed_result.symbol,
                         'source': source
                     })
-                
-                # Small delay between batches
-                time.sleep(1)
             
             self.last_collection_time = datetime.now()
             
@@ -193,6 +202,18 @@ class DataCollectionAgent(BaseAgent):
             })
             raise
     
+    async def _collect_batches_concurrently(self, collector: Any, batches: List[List[str]],
+                                            start_date: date, end_date: date) -> List[List[Any]]:
+        """Collect symbol batches concurrently, bounded by max_concurrent_batches"""
+        semaphore = asyncio.Semaphore(self.config['max_concurrent_batches'])
+        
+        async def collect(batch_symbols: List[str]) -> List[Any]:
+            async with semaphore:
+                return await asyncio.to_thread(collector.collect_batch, batch_symbols, start_date, end_date,
+                                               self.asset_class_map)
+        
+        return await asyncio.gather(*(collect(batch_symbols) for batch_symbols in batches))
+    
     def _collect_historical_data(self, task_data: Dict) -> Dict[str, Any]:
         """Collect historical market data"""
         symbols = task_data.get('symbols', self.config['symbols'])
@@ -227,44 +248,52 @@ class DataCollectionAgent(BaseAgent):
             else:
                 start_date = end_date - timedelta(days=365)  # Default to 1 year
             
-            # Collect data using collect_batch
-            batch_results = collector.collect_batch(symbols, start_date, end_date)
-            
-            # Process results
-            successful_results = [r for r in batch_results if r.success]
-            total_records = sum(r.records_collected for r in successful_results)
-            
-            if successful_results:
-                # Calculate average quality score
-                avg_quality = sum(r.data_quality_score or 0 for r in successful_results) / len(successful_results)
+            # Collect batch by batch; the collector writes each batch to the database,
+            # so results are folded into running totals in one pass and then released
+            batch_size = self.config['batch_size']
+            successful_symbols = []
+            failed_symbols = []
+            total_records = 0
+            quality_total = 0.0
+            for i in range(0, len(symbols), batch_size):
+                batch_results = collector.collect_batch(symbols[i:i + batch_size], start_date, end_date,
+                                                        self.asset_class_map)
                 
+                for result in batch_results:
+                    if result.success:
+                        quality = result.data_quality_score or 0
+                        successful_symbols.append(result.symbol)
+                        total_records += result.records_collected
+                        quality_total += quality
+                        
+                        # Update quality tracking
+                        self.data_quality_scores[result.symbol] = quality
+                    else:
+                        failed_symbols.append(result.symbol)
+                        self.collection_errors.append({
+                            'error': result.error_message,
+                            'timestamp': datetime.now().isoformat(),
+                            'symbol': result.symbol,
+                            'source': source,
+                            'period': period
+                        })
+                
+                del batch_results
+            
+            if successful_symbols:
                 results = {
                     'symbols': symbols,
-                    'successful_symbols': [r.symbol for r in successful_results],
+                    'successful_symbols': successful_symbols,
+                    'failed_symbols': failed_symbols,
                     'period': period,
                     'records_stored': total_records,
-                    'quality_score': avg_quality,
+                    'quality_score': quality_total / len(successful_symbols),
                     'data_range': {
                         'start': start_date.isoformat(),
                         'end': end_date.isoformat()
                     },
                     'timestamp': datetime.now().isoformat()
                 }
-                
-                # Update quality tracking
-                for result in successful_results:
-                    self.data_quality_scores[result.symbol] = result.data_quality_score or 0
-            
-            # Log any errors
-            failed_results = [r for r in batch_results if not r.success]
-            for failed_result in failed_results:
-                self.collection_errors.append({
-                    'error': failed_result.error_message,
-                    'timestamp': datetime.now().isoformat(),
-                    'symbol': failed_result.symbol,
-                    'source': source,
-                    'period': period
-                })
             
             return results
             
@@ -505,29 +534,24 @@ class DataCollectionAgent(BaseAgent):
             config = get_config()
             yahoo_config = config.get_data_source_config("yahoo_finance")
             
-            # Collect all symbols from different categories
-            all_symbols = []
-            
-            # Global indices
+            # Group symbols by category
             equities = yahoo_config.get('equities', {})
-            all_symbols.extend(equities.get('global_indices', []))
-            all_symbols.extend(equities.get('sector_etfs', []))
-            
-            # Other asset classes
-            all_symbols.extend(yahoo_config.get('commodities', []))
-            all_symbols.extend(yahoo_config.get('bonds', []))
-            all_symbols.extend(yahoo_config.get('currencies', []))
+            symbol_universe = {
+                'global_indices': equities.get('global_indices', []),
+                'sector_etfs': equities.get('sector_etfs', []),
+                'commodities': yahoo_config.get('commodities', []),
+                'bonds': yahoo_config.get('bonds', []),
+                'currencies': yahoo_config.get('currencies', [])
+            }
             
-            # Remove duplicates while preserving order
-            unique_symbols = []
-            seen = set()
-            for symbol in all_symbols:
-                if symbol not in seen:
-                    unique_symbols.append(symbol)
-                    seen.add(symbol)
+            # Map every symbol to its asset class; dict keys dedupe while preserving order
+            asset_class_map = {sym: self._CATEGORY_TO_CLASS.get(cat, 'equity')
+                               for cat, syms in symbol_universe.items() for sym in syms}
+            self.asset_class_map = asset_class_map
+            all_symbols = list(asset_class_map)
             
-            self.logger.info(f"Loaded {len(unique_symbols)} symbols from configuration")
-            return unique_symbols
+            self.logger.info(f"Loaded {len(all_symbols)} symbols from configuration")
+            return all_symbols
             
         except Exception as e:
             self.logger.warning(f"Failed to load comprehensive symbol list: {e}")
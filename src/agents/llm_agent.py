@@ -20,6 +20,7 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import json
 import threading
+from queue import Empty
 
 from .base_agent import BaseAgent, Task, TaskPriority, AgentStatus
 from ..data.database_manager import DatabaseManager
@@ -63,7 +64,8 @@ default_config = {
 ],
 'response_max_length': 512,
 'analysis_depth': 'comprehensive',
-'enable_chat_interface': True
+'enable_chat_interface': True,
+'max_search_batch': 8  # Queued text searches answered per index call
 }
 
 if config:
@@ -81,6 +83,7 @@ self.analysis_history = []
 self.active_insights = {}
 self.last_analysis_time = None
 self.conversation_context = {}
+self._batched_results = {}  # task id -> result computed by a batched search
 
 self.logger.info("LLM Agent initialized")
 
@@ -356,7 +359,14 @@ results = self.vector_db.search_by_symbol_pattern(symbol, price_data, k=k)
 else:
 return {'error': f'Unknown query type: {query_type}'}
 
-# Apply additional filters
+return self._format_similarity_results(results, query_type, filters)
+
+except Exception as e:
+self.logger.error(f"Similarity search failed: {e}")
+return {'error': str(e)}
+
+def _format_similarity_results(self, results: List[Dict], query_type: str, filters: Dict) -> Dict[str, Any]:
+"""Apply filters to similarity search results and wrap them in a task response."""
 if filters:
 results = self._apply_similarity_filters(results, filters)
 
@@ -367,9 +377,61 @@ return {
 'timestamp': datetime.now().isoformat()
 }
 
+@staticmethod
+def _is_text_search(task: Task) -> bool:
+"""Check whether a task is a text similarity search that can be batched."""
+return (task.data.get('type') == 'similarity_search'
+and task.data.get('query_type', 'text') == 'text')
+
+def _batch_text_search_tasks(self, task: Task) -> Dict[str, Any]:
+"""
+Run a text similarity search together with other queued text searches.
+
+Ready text searches are pulled from the task queue and answered with one
+search_by_text_queries call per k. Every drained task is re-queued in its
+original order; the batched ones complete immediately with their
+precomputed results when the worker reaches them.
+"""
+batch = [task]
+drained = []
+now = datetime.now()
+
+while True:
+try:
+queued = self.task_queue.get_nowait()
+except Empty:
+break
+self.task_queue.task_done()
+drained.append(queued)
+if (len(batch) < self.config['max_search_batch']
+and self._is_text_search(queued)
+and queued.scheduled_at <= now):
+batch.append(queued)
+
+for queued in drained:
+self.task_queue.put(queued)
+
+self.logger.info(f"Performing similarity search: text ({len(batch)} queries)")
+
+try:
+tasks_by_k = {}
+for batched in batch:
+tasks_by_k.setdefault(batched.data.get('k', 5), []).append(batched)
+
+for k, group in tasks_by_k.items():
+queries = [batched.data.get('query_data', '') for batched in group]
+all_results = self.vector_db.search_by_text_queries(queries, k=k)
+for batched, results in zip(group, all_results):
+self._batched_results[batched.id] = self._format_similarity_results(
+results, 'text', batched.data.get('filters', {})
+)
+
 except Exception as e:
 self.logger.error(f"Similarity search failed: {e}")
-return {'error': str(e)}
+for batched in batch:
+self._batched_results[batched.id] = {'error': str(e)}
+
+return self._batched_results.pop(task.id)
 
 def _prepare_market_data_for_analysis(self, market_data: pd.DataFrame, symbols: List[str]) -> Dict[str, Any]:
 """Prepare market data for LLM analysis."""
@@ -557,8 +619,20 @@ return status
 
 def execute_task(self, task: Task) -> Any:
 """Execute a task (required by BaseAgent)."""
+# Answered ahead of time by a batched similarity search
+if task.id in self._batched_results:
+return self._batched_results.pop(task.id)
+
+if self._is_text_search(task):
+return self._batch_text_search_tasks(task)
+
 return self._handle_task(task)
 
+def stop(self):
+"""Stop the agent and drop precomputed results of tasks that will not run."""
+super().stop()
+self._batched_results.clear()
+
 
 if __name__ == "__main__":
 # Test LLM agent functionality
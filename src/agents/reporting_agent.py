@@ -632,8 +632,13 @@ class ReportingAgent(BaseAgent):
             df.to_csv(filename, index=False)
         
         elif export_type == 'json':
+            analysis_agent = self._get_analysis_agent() if data_source == 'analysis_results' else None
             with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+                if analysis_agent is not None:
+                    # Results hold NumPy arrays and NaNs; the agent's serializer handles both
+                    f.write(analysis_agent.dumps_results())
+                else:
+                    json.dump(export_data, f, indent=2, default=str)
         
         return {
             'filename': filename,
@@ -650,9 +655,17 @@ class ReportingAgent(BaseAgent):
             return self.alert_history
         elif data_source == 'notifications':
             return self.notification_queue
+        elif data_source == 'analysis_results':
+            analysis_agent = self._get_analysis_agent()
+            return analysis_agent.analysis_results if analysis_agent else {}
         else:
             return {}
     
+    def _get_analysis_agent(self):
+        """Get the registered analysis agent, if any"""
+        from .base_agent import agent_registry
+        return agent_registry.get_agent('analysis-agent-001')
+    
     def _cleanup_old_reports(self, task_data: Dict) -> Dict[str, Any]:
         """Clean up old report files"""
         retention_days = task_data.get('retention_days', 30)
@@ -367,16 +367,45 @@ async def vector_search_flexible(data: Dict[str, Any] = Body(...)):
     Perform similarity search in vector database (flexible endpoint).
     
     Args:
-        data: Vector search data (flexible format)
+        data: Vector search data (flexible format); pass a 'queries' list
+            to search several text queries in one index call
         
     Returns:
         Similar patterns from vector database
     """
+    queries = data.get('queries')
+    if queries is not None and not (
+        isinstance(queries, list) and queries and all(isinstance(q, str) for q in queries)
+    ):
+        raise HTTPException(status_code=400, detail="'queries' must be a non-empty list of strings")
+    
     try:
         query = data.get('query_data', data.get('query', 'tech stocks'))
         query_type = data.get('query_type', 'text')
         k = data.get('k', 5)
         
+        if queries:
+            logger.info(f"Performing batched vector search for {len(queries)} queries")
+            
+            # Encode all queries together and search them with one index call
+            all_results = vector_db.search_by_text_queries(queries, k=k)
+            formatted_batches = [
+                [_format_vector_result(result) for result in results]
+                for results in all_results
+            ]
+            total = sum(len(results) for results in formatted_batches)
+            
+            return {
+                "status": "success",
+                "data": {
+                    "results": formatted_batches,
+                    "count": total,
+                    "queries": queries,
+                    "query_type": "text"
+                },
+                "message": f"Found {total} similar patterns for {len(queries)} queries"
+            }
+        
         logger.info(f"Performing vector search: {query_type} for '{query}'")
         
         # Use actual vector database for search
@@ -393,18 +422,7 @@ async def vector_search_flexible(data: Dict[str, Any] = Body(...)):
             results = vector_db.search_by_text_query(query, k=k)
         
         # Format results for API response
-        formatted_results = []
-        for result in results:
-            formatted_results.append({
-                "pattern_id": result.get('pattern_id', ''),
-                "symbol": result.get('symbol', ''),
-                "similarity_score": result.get('similarity_score', 0.0),
-                "pattern_type": result.get('pattern_type', ''),
-                "description": f"Pattern: {result.get('pattern_id', '')} for {result.get('symbol', '')}",
-                "metadata": result.get('metadata', {}),
-                "timestamp": result.get('timestamp', ''),
-                "distance": result.get('distance', 0.0)
-            })
+        formatted_results = [_format_vector_result(result) for result in results]
         
         return {
             "status": "success",
@@ -426,6 +444,20 @@ async def vector_search_flexible(data: Dict[str, Any] = Body(...)):
         }
 
 
+def _format_vector_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a vector database search hit for API responses."""
+    return {
+        "pattern_id": result.get('pattern_id', ''),
+        "symbol": result.get('symbol', ''),
+        "similarity_score": result.get('similarity_score', 0.0),
+        "pattern_type": result.get('pattern_type', ''),
+        "description": f"Pattern: {result.get('pattern_id', '')} for {result.get('symbol', '')}",
+        "metadata": result.get('metadata', {}),
+        "timestamp": result.get('timestamp', ''),
+        "distance": result.get('distance', 0.0)
+    }
+
+
 @router.post("/vector/store")
 async def store_pattern(request: PatternStorageRequest):
     """
@@ -184,6 +184,23 @@ async def start_workflow(
         logger.error(f"Failed to start workflow: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to start workflow: {str(e)}")
 
+def _workflow_status_payload(workflow) -> Dict[str, Any]:
+    """Serialize a workflow result for the status and stream endpoints."""
+    return {
+        "workflow_id": workflow.workflow_id,
+        "status": workflow.status.value,
+        "current_stage": workflow.current_stage.value,
+        "stages_completed": [stage.value for stage in workflow.stages_completed],
+        "errors": workflow.errors,
+        "started_at": workflow.started_at.isoformat(),
+        "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None,
+        "duration": workflow.duration,
+        "results_summary": {
+            stage: result.get('success', False) 
+            for stage, result in workflow.results.items()
+        }
+    }
+
 @app.get("/workflow/{workflow_id}/status")
 async def get_workflow_status(workflow_id: str):
     """Get workflow status."""
@@ -196,20 +213,7 @@ async def get_workflow_status(workflow_id: str):
         if not workflow:
             raise HTTPException(status_code=404, detail="Workflow not found")
         
-        return {
-            "workflow_id": workflow.workflow_id,
-            "status": workflow.status.value,
-            "current_stage": workflow.current_stage.value,
-            "stages_completed": [stage.value for stage in workflow.stages_completed],
-            "errors": workflow.errors,
-            "started_at": workflow.started_at.isoformat(),
-            "completed_at": workflow.completed_at.isoformat() if workflow.completed_at else None,
-            "duration": workflow.duration,
-            "results_summary": {
-                stage: result.get('success', False) 
-                for stage, result in workflow.results.items()
-            }
-        }
+        return _workflow_status_payload(workflow)
         
     except HTTPException:
         raise
@@ -217,6 +221,41 @@ async def get_workflow_status(workflow_id: str):
         logger.error(f"Failed to get workflow status: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get workflow status: {str(e)}")
 
+@app.get("/workflow/{workflow_id}/stream")
+async def stream_workflow_status(workflow_id: str):
+    """Stream workflow status as Server-Sent Events, one frame per change."""
+    if not workflow_manager:
+        raise HTTPException(status_code=503, detail="Workflow manager not available")
+    
+    if not workflow_manager.get_workflow_status(workflow_id):
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    
+    terminal_statuses = {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED}
+    
+    async def event_stream():
+        last_frame = None
+        while True:
+            workflow = workflow_manager.get_workflow_status(workflow_id)
+            if not workflow:
+                break
+            
+            # Status is read in-process; only transitions go over the wire
+            frame = json.dumps(_workflow_status_payload(workflow), default=str)
+            if frame != last_frame:
+                yield f"data: {frame}\n\n"
+                last_frame = frame
+            
+            if workflow.status in terminal_statuses:
+                break
+            
+            await asyncio.sleep(0.5)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
 # Data Endpoints
 @app.get("/data/market")
 async def get_market_data(
@@ -9,12 +9,16 @@ Author: Multi-Market Correlation Engine Team
 Version: 0.1.0
 """
 
+import os
 import time
+import atexit
 import logging
+import threading
+import multiprocessing
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import warnings
 
 import pandas as pd
@@ -32,6 +36,40 @@ warnings.filterwarnings("ignore", module="yfinance")
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Long-lived worker pool for CPU-bound cleaning of downloaded frames; workers
+# import this module (pandas, numpy) once and are reused across batches.
+# Workers come from a fork server (spawn where unavailable), since batches are
+# submitted from collector threads and fork() would copy their held locks
+_PARSE_POOL = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+# Batches with fewer rows are cleaned in-process: the cleaning is light
+# vectorized pandas, and pickling frames to a worker and back costs more
+PARSE_POOL_MIN_ROWS = 50_000
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+"""Get the shared process pool, creating it on first use."""
+global _PARSE_POOL
+with _PARSE_POOL_LOCK:
+if _PARSE_POOL is None:
+method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+_PARSE_POOL = ProcessPoolExecutor(
+max_workers=os.cpu_count(),
+mp_context=multiprocessing.get_context(method)
+)
+atexit.register(_shutdown_parse_pool)
+return _PARSE_POOL
+
+
+def _shutdown_parse_pool():
+"""Shut the shared process pool down, cancelling queued work."""
+global _PARSE_POOL
+with _PARSE_POOL_LOCK:
+if _PARSE_POOL is not None:
+_PARSE_POOL.shutdown(wait=False, cancel_futures=True)
+_PARSE_POOL = None
+
 
 @dataclass
 class CollectionResult:
@@ -57,9 +95,16 @@ max_calls_per_minute: Maximum API calls per minute
 """
 self.max_calls = max_calls_per_minute
 self.calls = []
+self._lock = threading.Lock()
 
 def wait_if_needed(self) -> None:
 """Wait if rate limit would be exceeded."""
+# Serialize callers so concurrent batches share one call budget
+with self._lock:
+self._wait_if_needed()
+
+def _wait_if_needed(self) -> None:
+"""Wait if rate limit would be exceeded (caller holds the lock)."""
 now = datetime.utcnow()
 
 # Remove calls older than 1 minute
@@ -134,6 +179,39 @@ ticker = yf.Ticker(symbol)
 # Fetch historical data with retry logic
 data = self._fetch_with_retry(ticker, start_date, end_date)
 
+except Exception as e:
+logger.error(f"Failed to collect data for {symbol}: {e}")
+return CollectionResult(
+success=False,
+symbol=symbol,
+records_collected=0,
+error_message=str(e)
+)
+
+return self._process_symbol_data(symbol, data, start_date, end_date, asset_class)
+
+def _process_symbol_data(
+self,
+symbol: str,
+data: Optional[pd.DataFrame],
+start_date: date,
+end_date: date,
+asset_class: str
+) -> CollectionResult:
+"""
+Clean, score and store fetched data for a single symbol.
+
+Args:
+symbol: Symbol the data belongs to
+data: Raw market data DataFrame (or None if the fetch failed)
+start_date: Start date for collection
+end_date: End date for collection
+asset_class: Asset class (equity, commodity, currency, etc.)
+
+Returns:
+CollectionResult with operation details
+"""
+try:
 if data is None or data.empty:
 return CollectionResult(
 success=False,
@@ -145,6 +223,42 @@ error_message="No data returned from Yahoo Finance"
 # Clean and validate data
 cleaned_data = self._clean_and_validate_data(data, symbol, asset_class)
 
+# Calculate data quality score
+quality_score = self._calculate_data_quality(cleaned_data)
+
+except Exception as e:
+logger.error(f"Failed to collect data for {symbol}: {e}")
+return CollectionResult(
+success=False,
+symbol=symbol,
+records_collected=0,
+error_message=str(e)
+)
+
+return self._store_cleaned_data(symbol, cleaned_data, quality_score, start_date, end_date)
+
+def _store_cleaned_data(
+self,
+symbol: str,
+cleaned_data: pd.DataFrame,
+quality_score: float,
+start_date: date,
+end_date: date
+) -> CollectionResult:
+"""
+Save cleaned data for a single symbol to the database.
+
+Args:
+symbol: Symbol the data belongs to
+cleaned_data: Output of _clean_and_validate_data
+quality_score: Output of _calculate_data_quality
+start_date: Start date for collection
+end_date: End date for collection
+
+Returns:
+CollectionResult with operation details
+"""
+try:
 if cleaned_data.empty:
 return CollectionResult(
 success=False,
@@ -153,9 +267,6 @@ records_collected=0,
 error_message="Data failed validation"
 )
 
-# Calculate data quality score
-quality_score = self._calculate_data_quality(cleaned_data)
-
 # Save to database
 records_saved = self.db_manager.save_market_data(
 cleaned_data,
@@ -228,8 +339,80 @@ break
 
 return None
 
-def _clean_and_validate_data(
+def _download_batch(
 self,
+symbols: List[str],
+start_date: date,
+end_date: date,
+max_retries: int = 3
+) -> Optional[pd.DataFrame]:
+"""
+Download data for several symbols with a single multi-ticker request.
+
+Args:
+symbols: Symbols to download
+start_date: Start date
+end_date: End date
+max_retries: Maximum retry attempts
+
+Returns:
+DataFrame with one column group per ticker, or None if failed
+"""
+self.rate_limiter.wait_if_needed()
+
+for attempt in range(max_retries):
+try:
+data = yf.download(
+" ".join(symbols),
+start=start_date,
+end=end_date,
+interval="1d",
+auto_adjust=False,
+prepost=True,
+group_by="ticker",
+threads=True,
+progress=False
+)
+
+if data is not None and not data.empty:
+return data
+
+logger.warning(f"Empty batch download on attempt {attempt + 1} for {len(symbols)} symbols")
+
+except (RequestException, Timeout) as e:
+logger.warning(f"Network error on attempt {attempt + 1}: {e}")
+if attempt < max_retries - 1:
+time.sleep(2 ** attempt) # Exponential backoff
+
+except Exception as e:
+logger.error(f"Unexpected error downloading batch: {e}")
+break
+
+return None
+
+@staticmethod
+def _extract_symbol_frame(batch_data: pd.DataFrame, symbol: str) -> Optional[pd.DataFrame]:
+"""
+Slice one ticker's OHLCV frame out of a multi-ticker download.
+
+Args:
+batch_data: DataFrame returned by yf.download with group_by="ticker"
+symbol: Symbol to extract
+
+Returns:
+Symbol DataFrame without the all-NaN rows from calendar alignment
+"""
+if isinstance(batch_data.columns, pd.MultiIndex):
+if symbol not in batch_data.columns.get_level_values(0):
+return None
+data = batch_data[symbol]
+else:
+data = batch_data
+
+return data.dropna(how="all")
+
+@staticmethod
+def _clean_and_validate_data(
 data: pd.DataFrame,
 symbol: str,
 asset_class: str
@@ -288,10 +471,10 @@ if len(df) < initial_rows:
 logger.warning(f"Removed {initial_rows - len(df)} rows with missing close prices for {symbol}")
 
 # Basic price validation
-df = self._validate_prices(df, symbol)
+df = YahooFinanceCollector._validate_prices(df, symbol)
 
 # Remove outliers
-df = self._remove_outliers(df, symbol)
+df = YahooFinanceCollector._remove_outliers(df, symbol)
 
 # Sort by date
 df = df.sort_values('date').reset_index(drop=True)
@@ -302,7 +485,8 @@ except Exception as e:
 logger.error(f"Failed to clean data for {symbol}: {e}")
 return pd.DataFrame()
 
-def _validate_prices(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+@staticmethod
+def _validate_prices(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
 """
 Validate price data for basic sanity checks.
 
@@ -345,7 +529,8 @@ logger.warning(f"Removed {removed_rows} rows with invalid prices for {symbol}")
 
 return df
 
-def _remove_outliers(self, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+@staticmethod
+def _remove_outliers(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
 """
 Remove statistical outliers from the data.
 
@@ -380,7 +565,8 @@ logger.info(f"Removed {removed_rows} outliers for {symbol}")
 
 return df
 
-def _calculate_data_quality(self, df: pd.DataFrame) -> float:
+@staticmethod
+def _calculate_data_quality(df: pd.DataFrame) -> float:
 """
 Calculate data quality score (0-1).
 
@@ -438,23 +624,137 @@ asset_classes: Optional[Dict[str, str]] = None,
 max_workers: int = 5
 ) -> List[CollectionResult]:
 """
-Collect data for multiple symbols in parallel.
+Collect data for multiple symbols with one multi-ticker download.
+
+Falls back to concurrent per-symbol collection if the batch download fails.
 
 Args:
 symbols: List of symbols to collect
 start_date: Start date for collection
 end_date: End date for collection
 asset_classes: Dict mapping symbols to asset classes
-max_workers: Maximum number of concurrent workers
+max_workers: Maximum number of concurrent workers for the fallback path
 
 Returns:
 List of CollectionResult objects
 """
 logger.info(f"Starting batch collection for {len(symbols)} symbols")
 
-results = []
 asset_classes = asset_classes or {}
 
+batch_data = self._download_batch(symbols, start_date, end_date)
+
+if batch_data is None:
+logger.warning("Batch download failed, falling back to per-symbol collection")
+results = self._collect_batch_per_symbol(
+symbols, start_date, end_date, asset_classes, max_workers
+)
+else:
+results = self._process_batch_frames(
+symbols, batch_data, start_date, end_date, asset_classes
+)
+
+# Log summary
+successful = sum(1 for r in results if r.success)
+total_records = sum(r.records_collected for r in results)
+
+logger.info(f"Batch collection complete: {successful}/{len(symbols)} symbols successful, "
+f"{total_records} total records collected")
+
+return results
+
+def _process_batch_frames(
+self,
+symbols: List[str],
+batch_data: pd.DataFrame,
+start_date: date,
+end_date: date,
+asset_classes: Dict[str, str]
+) -> List[CollectionResult]:
+"""
+Clean a multi-ticker download in the worker pool and store each symbol.
+
+Cleaning and quality scoring run in worker processes once the batch has
+at least PARSE_POOL_MIN_ROWS rows; database writes stay in this process.
+Smaller batches, and symbols whose worker task fails, are cleaned in-process.
+
+Args:
+symbols: Symbols in the batch
+batch_data: DataFrame returned by _download_batch
+start_date: Start date for collection
+end_date: End date for collection
+asset_classes: Dict mapping symbols to asset classes
+
+Returns:
+List of CollectionResult objects
+"""
+frames = {symbol: self._extract_symbol_frame(batch_data, symbol) for symbol in symbols}
+
+futures = {}
+total_rows = sum(len(frame) for frame in frames.values() if frame is not None)
+if total_rows >= PARSE_POOL_MIN_ROWS:
+try:
+pool = _get_parse_pool()
+for symbol, frame in frames.items():
+if frame is not None and not frame.empty:
+futures[symbol] = pool.submit(
+_clean_symbol_frame, symbol, frame, asset_classes.get(symbol, "equity")
+)
+except Exception as e:
+logger.warning(f"Process pool unavailable, cleaning batch in-process: {e}")
+
+results = []
+with tqdm(total=len(symbols), desc="Processing data") as pbar:
+for symbol in symbols:
+asset_class = asset_classes.get(symbol, "equity")
+future = futures.get(symbol)
+
+result = None
+if future is not None:
+try:
+cleaned_data, quality_score = future.result()
+result = self._store_cleaned_data(
+symbol, cleaned_data, quality_score, start_date, end_date
+)
+except Exception as e:
+logger.warning(f"Worker cleaning failed for {symbol}, retrying in-process: {e}")
+
+if result is None:
+result = self._process_symbol_data(
+symbol, frames[symbol], start_date, end_date, asset_class
+)
+results.append(result)
+
+# Update progress bar
+status = "✓" if result.success else "✗"
+pbar.set_postfix_str(f"{symbol}: {status}")
+pbar.update(1)
+
+return results
+
+def _collect_batch_per_symbol(
+self,
+symbols: List[str],
+start_date: date,
+end_date: date,
+asset_classes: Dict[str, str],
+max_workers: int = 5
+) -> List[CollectionResult]:
+"""
+Collect data for multiple symbols in parallel, one request per symbol.
+
+Args:
+symbols: List of symbols to collect
+start_date: Start date for collection
+end_date: End date for collection
+asset_classes: Dict mapping symbols to asset classes
+max_workers: Maximum number of concurrent workers
+
+Returns:
+List of CollectionResult objects
+"""
+results = []
+
 # Use ThreadPoolExecutor for concurrent collection
 with ThreadPoolExecutor(max_workers=max_workers) as executor:
 # Submit all tasks
@@ -493,13 +793,6 @@ error_message=str(e)
 ))
 pbar.update(1)
 
-# Log summary
-successful = sum(1 for r in results if r.success)
-total_records = sum(r.records_collected for r in results)
-
-logger.info(f"Batch collection complete: {successful}/{len(symbols)} symbols successful, "
-f"{total_records} total records collected")
-
 return results
 
 def collect_predefined_universe(
@@ -553,6 +846,22 @@ asset_classes=asset_classes
 )
 
 
+def _clean_symbol_frame(symbol: str, data: pd.DataFrame, asset_class: str) -> Tuple[pd.DataFrame, float]:
+"""
+Clean and score one symbol's frame; runs in the shared process pool.
+
+Args:
+symbol: Symbol the data belongs to
+data: Raw market data DataFrame
+asset_class: Asset class (equity, commodity, currency, etc.)
+
+Returns:
+Tuple of (cleaned DataFrame, data quality score)
+"""
+cleaned_data = YahooFinanceCollector._clean_and_validate_data(data, symbol, asset_class)
+return cleaned_data, YahooFinanceCollector._calculate_data_quality(cleaned_data)
+
+
 # Example usage and testing
 if __name__ == "__main__":
 # Test Yahoo Finance collector
@@ -6,8 +6,10 @@ environment variables, and default values.
 """
 
 import os
+import copy
 import yaml
 import logging
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -20,6 +22,23 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML file once per modification time."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f) or {}
+
+
+def load_yaml_file(path: Path) -> Dict[str, Any]:
+    """
+    Load a YAML file, reusing the parse while the file is unchanged.
+
+    The cache is keyed on the file's mtime so edits are picked up; callers get
+    a deep copy and may modify it freely.
+    """
+    return copy.deepcopy(_parse_yaml_file(str(path), path.stat().st_mtime))
+
+
 @dataclass
 class DataSourceConfig:
     """Configuration for data sources."""
@@ -111,8 +130,7 @@ class ConfigManager:
         data_sources_file = self.config_dir / "data_sources.yaml"
         if data_sources_file.exists():
             try:
-                with open(data_sources_file, 'r') as f:
-                    data_sources_config = yaml.safe_load(f)
+                data_sources_config = load_yaml_file(data_sources_file)
                 self.config.data_sources = DataSourceConfig(**data_sources_config)
                 logger.info(f"Loaded data sources config from {data_sources_file}")
             except Exception as e:
@@ -151,6 +169,10 @@ class ConfigManager:
         }
         return key_map.get(service)
 
+    def get_data_source_config(self, source: str) -> Dict[str, Any]:
+        """Get configuration for a data source section (e.g. "yahoo_finance")."""
+        return getattr(self.config.data_sources, source, None) or {}
+
     def get_database_url(self) -> str:
         """Get database connection URL."""
         return self.config.database.url
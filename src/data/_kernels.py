@@ -0,0 +1,63 @@
+"""
+Numba kernels for vector similarity search
+==========================================
+
+JIT-compiled inner loops used by the vector database when a small Flat
+corpus is searched without FAISS or SimSIMD.
+
+Author: Multi-Market Correlation Engine Team
+Version: 1.0.0
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+from .._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cosine_scores(mat: np.ndarray, scales: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Dot every row of an L2-normalized matrix with a normalized query.
+
+    Args:
+        mat: Stored vectors of shape (N, dimension), float32 or int8
+        scales: Per-row dequantization scales (ones for float32 storage)
+        q: L2-normalized float32 query of shape (dimension,)
+
+    Returns:
+        Cosine similarity of each row, shape (N,)
+    """
+    n_rows = mat.shape[0]
+    n_cols = mat.shape[1]
+    out = np.empty(n_rows, np.float32)
+    for i in prange(n_rows):
+        s = 0.0
+        for j in range(n_cols):
+            s += mat[i, j] * q[j]
+        out[i] = s * scales[i]
+    return out
+
+
+def topk_cosine(mat: np.ndarray, scales: np.ndarray, q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows most similar to a query.
+
+    Args:
+        mat: Stored vectors of shape (N, dimension), float32 or int8
+        scales: Per-row dequantization scales
+        q: Query vector of shape (dimension,)
+        k: Number of neighbours to return
+
+    Returns:
+        Tuple of (row indices, cosine similarities), best match first
+    """
+    norm = np.linalg.norm(q)
+    q = np.ascontiguousarray(q / norm if norm > 0 else q, dtype=np.float32)
+    scores = cosine_scores(mat, scales, q)
+
+    k = min(k, scores.shape[0])
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    return idx, scores[idx]
@@ -19,7 +19,7 @@ import pandas as pd
 import numpy as np
 from sqlalchemy import (
 create_engine, Column, Integer, String, Float, DateTime, Date,
-Boolean, Text, Index, ForeignKey, UniqueConstraint
+Boolean, Text, Index, ForeignKey, UniqueConstraint, select, func
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
@@ -469,11 +469,16 @@ Dictionary with quality metrics
 """
 try:
 with self.get_session() as session:
-# Market data quality
-market_data_count = session.query(MarketData).count()
+# Market data quality: symbol and row counts in one scalar query
+market_symbol_count, market_data_count = session.execute(
+select(func.count(func.distinct(MarketData.symbol)), func.count())
+.select_from(MarketData)
+).one()
 
 # Correlation data quality
-correlation_count = session.query(CorrelationData).count()
+correlation_count = session.execute(
+select(func.count()).select_from(CorrelationData)
+).scalar_one()
 
 # Latest quality checks
 latest_quality = session.query(DataQuality).order_by(
@@ -482,6 +487,7 @@ DataQuality.check_date.desc()
 
 summary = {
 'market_data_records': market_data_count,
+'market_data_symbols': market_symbol_count,
 'correlation_records': correlation_count,
 'latest_quality_checks': [
 {
@@ -732,8 +732,7 @@ def create_etl_pipeline() -> ETLPipeline:
         database_path='data/market_data.db'
     )
     
-    # Ensure directories exist
-    os.makedirs('data', exist_ok=True)
+    # Ensure directories exist (creates data/ as a parent)
     os.makedirs('data/processed', exist_ok=True)
     
     return ETLPipeline(config)
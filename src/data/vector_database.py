@@ -12,6 +12,10 @@ Version: 1.0.0
 import os
 import pickle
 import logging
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import numpy as np
@@ -22,22 +26,130 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 
 from ..config.config_manager import get_config
+from ._kernels import NUMBA_AVAILABLE, topk_cosine
+
+# Optional SIMD cosine kernels for small Flat corpora
+try:
+import simsimd
+SIMSIMD_AVAILABLE = True
+except ImportError:
+SIMSIMD_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Flat indexes below this size are searched with SimSIMD instead of FAISS
+SIMSIMD_MAX_VECTORS = 50_000
+
+# Without SimSIMD, Flat indexes below this size use the Numba cosine kernel
+NUMBA_MAX_VECTORS = 10_000
+
+# Supported storage types for the contiguous flat matrix
+STORE_DTYPES = {"float32": np.float32, "int8": np.int8}
+
+# Serializes first loads so concurrent constructors don't load the same model twice
+_MODEL_LOAD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_shared_model(model_name: str) -> SentenceTransformer:
+"""Load a sentence model once per process."""
+logger.info(f"Loading sentence model {model_name}")
+return SentenceTransformer(model_name)
+
+
+def _get_shared_model(model_name: str) -> SentenceTransformer:
+"""
+Get the process-wide sentence model instance for a model name.
+
+Args:
+model_name: SentenceTransformer model name
+
+Returns:
+Shared SentenceTransformer instance
+"""
+with _MODEL_LOAD_LOCK:
+return _load_shared_model(model_name)
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+"""
+Symmetrically quantize vectors to int8 with one scale per row.
+
+Args:
+vectors: Float matrix of shape (N, dimension)
+
+Returns:
+Tuple of (int8 matrix, float32 per-row scales)
+"""
+scales = np.abs(vectors).max(axis=1) / 127.0
+scales[scales == 0] = 1.0
+quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+return quantized, scales.astype(np.float32)
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+"""
+Scale each row to unit length, leaving all-zero rows as they are.
+
+On unit vectors squared L2 distance is twice the cosine distance, so a FAISS
+Flat index and the cosine fast paths rank and score results identically.
+
+Args:
+vectors: Float matrix of shape (N, dimension)
+
+Returns:
+Float32 matrix of unit-length rows
+"""
+vectors = np.asarray(vectors, dtype=np.float32)
+norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+norms[norms == 0] = 1.0
+return vectors / norms
+
+
+def _save_npy_atomic(path: str, array: np.ndarray):
+"""
+Write an array to a .npy file via a temporary file and an atomic rename.
+
+Readers holding a memory map of the old file keep their view, and a failed
+write never leaves a truncated file behind.
+
+Args:
+path: Destination .npy path
+array: Array to save
+"""
+tmp_path = f"{path}.tmp.npy"
+try:
+np.save(tmp_path, array)
+os.replace(tmp_path, path)
+except Exception:
+if os.path.exists(tmp_path):
+os.remove(tmp_path)
+raise
+
 
 class FinancialEmbedding:
 """
 Generate embeddings for financial data patterns.
 """
 
-def __init__(self):
-"""Initialize the financial embedding generator."""
-self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+def __init__(self, text_cache_size: int = 1024, model_name: str = 'all-MiniLM-L6-v2'):
+"""
+Initialize the financial embedding generator.
+
+Args:
+text_cache_size: Maximum number of text embeddings kept in the LRU cache
+model_name: SentenceTransformer model, shared across instances
+"""
+self.model_name = model_name
+self.sentence_model = _get_shared_model(model_name)
 self.scaler = StandardScaler()
 self.pca = PCA(n_components=384) # Match sentence transformer dimensions
 self.is_fitted = False
 
+# LRU cache of text -> embedding, shared by single and batched encodes
+self.text_cache_size = text_cache_size
+self._text_cache = OrderedDict()
+
 def create_price_pattern_embedding(self, price_data: pd.Series, window: int = 30) -> np.ndarray:
 """
 Create embeddings from price patterns.
@@ -191,13 +303,126 @@ text: Input text
 Returns:
 Embedding vector
 """
+cached = self._get_cached_text_embedding(text)
+if cached is not None:
+return cached
+
 try:
-embedding = self.sentence_model.encode(text)
-return embedding.astype(np.float32)
+embedding = self.sentence_model.encode(text).astype(np.float32)
+self._cache_text_embedding(text, embedding)
+return embedding
 except Exception as e:
 logger.error(f"Error creating text embedding: {e}")
 return np.zeros(384, dtype=np.float32)
 
+def create_text_embeddings(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+"""
+Create embeddings for several texts with a single batched encoder pass.
+
+Texts already in the cache are not re-encoded.
+
+Args:
+texts: Input texts
+batch_size: Encoder batch size
+
+Returns:
+Embedding matrix with one row per input text
+"""
+embeddings = {}
+missing = []
+for text in dict.fromkeys(texts):
+cached = self._get_cached_text_embedding(text)
+if cached is not None:
+embeddings[text] = cached
+else:
+missing.append(text)
+
+if missing:
+try:
+encoded = self.sentence_model.encode(
+missing,
+batch_size=batch_size,
+convert_to_numpy=True
+).astype(np.float32)
+for text, embedding in zip(missing, encoded):
+self._cache_text_embedding(text, embedding)
+embeddings[text] = embedding
+except Exception as e:
+logger.error(f"Error creating text embeddings: {e}")
+for text in missing:
+embeddings[text] = np.zeros(384, dtype=np.float32)
+
+if not texts:
+return np.zeros((0, 384), dtype=np.float32)
+
+return np.vstack([embeddings[text] for text in texts])
+
+def warmup(self, texts: List[str], cache_file: Optional[str] = None) -> np.ndarray:
+"""
+Pre-populate the text embedding cache.
+
+When cache_file is given, embeddings stored there by a previous run of the
+same model are loaded instead of re-encoded, and any new texts are added to
+the file alongside them.
+
+Args:
+texts: Texts expected to be queried
+cache_file: Optional .npz file holding precomputed embeddings
+
+Returns:
+Embedding matrix with one row per input text
+"""
+# text -> embedding from the file; vectors from another model are discarded
+stored_embeddings = {}
+if cache_file and os.path.exists(cache_file):
+try:
+with np.load(cache_file) as stored:
+if 'model' in stored and stored['model'].item() == self.model_name:
+stored_embeddings = dict(zip(stored['texts'].tolist(), stored['embeddings']))
+else:
+logger.info(f"Ignoring warmup embeddings in {cache_file} from another model")
+except Exception as e:
+logger.warning(f"Failed to load warmup embeddings from {cache_file}: {e}")
+
+for text, embedding in stored_embeddings.items():
+if text not in self._text_cache:
+self._cache_text_embedding(text, embedding.astype(np.float32))
+
+embeddings = self.create_text_embeddings(texts)
+
+new_rows = {text: row for row, text in enumerate(texts) if text not in stored_embeddings}
+if cache_file and new_rows:
+try:
+for text, row in new_rows.items():
+stored_embeddings[text] = embeddings[row].astype(np.float16)
+os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+np.savez(
+cache_file,
+model=np.array(self.model_name),
+texts=np.array(list(stored_embeddings)),
+embeddings=np.vstack(list(stored_embeddings.values())).astype(np.float16)
+)
+logger.info(f"Saved {len(stored_embeddings)} warmup embeddings to {cache_file}")
+except Exception as e:
+logger.warning(f"Failed to save warmup embeddings to {cache_file}: {e}")
+
+return embeddings
+
+def _get_cached_text_embedding(self, text: str) -> Optional[np.ndarray]:
+"""Return a cached text embedding and mark it as recently used."""
+embedding = self._text_cache.get(text)
+if embedding is not None:
+self._text_cache.move_to_end(text)
+return embedding
+
+def _cache_text_embedding(self, text: str, embedding: np.ndarray):
+"""Store a text embedding, evicting the least recently used entry."""
+embedding.setflags(write=False)
+self._text_cache[text] = embedding
+self._text_cache.move_to_end(text)
+while len(self._text_cache) > self.text_cache_size:
+self._text_cache.popitem(last=False)
+
 def create_composite_embedding(self,
 price_data: Optional[pd.Series] = None,
 correlation_data: Optional[pd.DataFrame] = None,
@@ -262,18 +487,28 @@ class FAISSVectorDatabase:
 FAISS-based vector database for financial data similarity search.
 """
 
-def __init__(self, dimension: int = 384, index_type: str = "IVF"):
+def __init__(self, dimension: int = 384, index_type: str = "IVF", store_dtype: str = "float32"):
 """
 Initialize FAISS vector database.
 
 Args:
 dimension: Embedding dimension
 index_type: FAISS index type (Flat, IVF, HNSW)
+store_dtype: Storage type of the flat SimSIMD matrix (float32, int8).
+With int8 the quantized matrix is the only copy of the vectors: no FAISS
+index is kept and metadata holds no float32 embeddings.
 """
+if store_dtype not in STORE_DTYPES:
+raise ValueError(f"Unsupported store dtype: {store_dtype}")
+if store_dtype == "int8" and index_type != "Flat":
+raise ValueError("int8 storage requires a Flat index")
+
 self.dimension = dimension
 self.index_type = index_type
+self.store_dtype = store_dtype
 self.index = None
 self.metadata = []
+self._pattern_rows = {} # pattern_id -> row position in the index and metadata
 self.embedding_generator = FinancialEmbedding()
 
 # Create FAISS index
@@ -288,7 +523,9 @@ logger.info(f"FAISS Vector Database initialized with {index_type} index, dimensi
 
 def _create_index(self):
 """Create FAISS index based on specified type."""
-if self.index_type == "Flat":
+if self.index_type == "Flat" and self.store_dtype == "int8":
+self.index = None # Searched from the int8 matrix alone
+elif self.index_type == "Flat":
 self.index = faiss.IndexFlatL2(self.dimension)
 elif self.index_type == "IVF":
 quantizer = faiss.IndexFlatL2(self.dimension)
@@ -298,8 +535,138 @@ self.index = faiss.IndexHNSWFlat(self.dimension, 32)
 else:
 raise ValueError(f"Unsupported index type: {self.index_type}")
 
+self._reset_flat_vectors()
+
 logger.info(f"Created FAISS {self.index_type} index")
 
+def _reset_flat_vectors(self):
+"""Empty the contiguous L2-normalized copy of the vectors used by the SimSIMD and Numba paths."""
+self._flat_vectors = np.zeros((0, self.dimension), dtype=STORE_DTYPES[self.store_dtype])
+self._flat_scales = np.zeros(0, dtype=np.float32)
+self._flat_count = 0
+
+def _append_flat_vector(self, embedding: np.ndarray):
+"""Append an L2-normalized embedding to the contiguous flat matrix."""
+if self._flat_count == self._flat_vectors.shape[0]:
+capacity = max(64, 2 * self._flat_count)
+grown = np.zeros((capacity, self.dimension), dtype=self._flat_vectors.dtype)
+grown[:self._flat_count] = self._flat_vectors[:self._flat_count]
+self._flat_vectors = grown
+grown_scales = np.ones(capacity, dtype=np.float32)
+grown_scales[:self._flat_count] = self._flat_scales[:self._flat_count]
+self._flat_scales = grown_scales
+
+norm = np.linalg.norm(embedding)
+normalized = (embedding / norm if norm > 0 else embedding).astype(np.float32)
+
+if self.store_dtype == "int8":
+quantized, scales = _quantize_int8(normalized.reshape(1, -1))
+self._flat_vectors[self._flat_count] = quantized[0]
+self._flat_scales[self._flat_count] = scales[0]
+else:
+self._flat_vectors[self._flat_count] = normalized
+self._flat_count += 1
+
+def _rebuild_flat_vectors(self):
+"""Rebuild the flat matrix from stored metadata, keeping index positions aligned."""
+self._reset_flat_vectors()
+missing = 0
+for meta in self.metadata:
+embedding = meta.get('embedding') if meta else None
+if embedding is None:
+missing += meta is not None
+embedding = np.zeros(self.dimension, dtype=np.float32)
+self._append_flat_vector(np.asarray(embedding, dtype=np.float32))
+if missing:
+# int8 stores keep no embeddings in metadata, so a lost matrix can't be recovered
+logger.warning(f"{missing} patterns have no stored embedding; their vectors are zeroed")
+
+@property
+def _ntotal(self) -> int:
+"""Number of stored vectors, with or without a FAISS index."""
+return self._flat_count if self.index is None else self.index.ntotal
+
+def _use_simsimd(self) -> bool:
+"""Check whether searches should bypass FAISS for the SimSIMD cosine path."""
+# Without a FAISS index there is nothing to hand large corpora to
+return (SIMSIMD_AVAILABLE
+and self.index_type == "Flat"
+and self._flat_count > 0
+and (self.index is None or self._flat_count < SIMSIMD_MAX_VECTORS))
+
+def _use_numba(self) -> bool:
+"""Check whether searches should use the Numba cosine kernel."""
+return (NUMBA_AVAILABLE
+and not SIMSIMD_AVAILABLE
+and self.index_type == "Flat"
+and self._flat_count > 0
+and (self.index is None or self._flat_count < NUMBA_MAX_VECTORS))
+
+def _search_index(self, queries: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+"""
+Search the stored vectors for the nearest neighbours of each query row.
+
+Args:
+queries: Query matrix of shape (Q, dimension)
+n: Number of neighbours per query
+
+Returns:
+FAISS-style (distances, indices) arrays of shape (Q, n); cosine distances
+for Flat indexes, squared L2 distances for IVF and HNSW
+"""
+queries = np.ascontiguousarray(queries, dtype=np.float32)
+if self._use_numba():
+return self._search_numba(queries, n)
+if self.index_type != "Flat":
+return self.index.search(queries, n)
+if self.index is None and not self._use_simsimd():
+return self._search_flat_numpy(queries, n)
+if not self._use_simsimd():
+# Flat vectors are stored unit length, so half the squared L2 distance
+# is the cosine distance the fast paths return
+distances, indices = self.index.search(_l2_normalize(queries), n)
+return distances / 2, indices
+
+# Cosine distance (1 - cos) over the contiguous matrix in one SIMD call.
+# Cosine is scale-invariant, so int8 rows and queries need no rescaling.
+matrix = self._flat_vectors[:self._flat_count]
+if self.store_dtype == "int8":
+queries, _ = _quantize_int8(queries)
+distances = np.asarray(simsimd.cdist(queries, matrix, metric="cosine"), dtype=np.float32)
+return self._top_n(distances, n)
+
+def _search_flat_numpy(self, queries: np.ndarray, n: int, block_rows: int = 4096) -> Tuple[np.ndarray, np.ndarray]:
+"""Cosine-search the int8 matrix with NumPy, dequantizing a block of rows at a time."""
+queries = _l2_normalize(queries)
+distances = np.empty((len(queries), self._flat_count), dtype=np.float32)
+for start in range(0, self._flat_count, block_rows):
+stop = min(start + block_rows, self._flat_count)
+block = self._flat_vectors[start:stop].astype(np.float32) * self._flat_scales[start:stop, None]
+distances[:, start:stop] = 1.0 - queries @ block.T
+return self._top_n(distances, n)
+
+def _top_n(self, distances: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+"""Pick the n smallest distances of each row of a (Q, N) distance matrix, nearest first."""
+n = min(n, self._flat_count)
+top = np.argpartition(distances, n - 1, axis=1)[:, :n]
+top_distances = np.take_along_axis(distances, top, axis=1)
+order = np.argsort(top_distances, axis=1)
+return np.take_along_axis(top_distances, order, axis=1), np.take_along_axis(top, order, axis=1)
+
+def _search_numba(self, queries: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+"""Search the flat matrix one query at a time with the parallel Numba kernel."""
+matrix = self._flat_vectors[:self._flat_count]
+scales = self._flat_scales[:self._flat_count]
+n = min(n, self._flat_count)
+
+distances = np.empty((len(queries), n), dtype=np.float32)
+indices = np.empty((len(queries), n), dtype=np.int64)
+for row, query in enumerate(queries):
+top, similarities = topk_cosine(matrix, scales, query, n)
+indices[row] = top
+distances[row] = 1.0 - similarities # Cosine distance, as in the SimSIMD path
+return distances, indices
+
 def add_financial_pattern(self,
 pattern_id: str,
 symbol: str,
@@ -358,12 +725,17 @@ embedding_2d = embedding.reshape(1, -1)
 # Train index if needed (for IVF)
 if self.index_type == "IVF" and not self.index.is_trained:
 if len(self.metadata) >= 100: # Need enough data to train
-all_embeddings = np.array([self._get_embedding_by_id(mid['pattern_id'])
-for mid in self.metadata if mid is not None])
+all_embeddings = np.array([meta['embedding'] for meta in self.metadata if meta is not None])
 if len(all_embeddings) > 0:
 self.index.train(all_embeddings)
 
 if self.index_type != "IVF" or self.index.is_trained:
+# Only Flat indexes share their vectors with the cosine fast paths
+if self.index_type == "Flat":
+if self.index is not None:
+self.index.add(_l2_normalize(embedding_2d))
+self._append_flat_vector(embedding)
+else:
 self.index.add(embedding_2d)
 
 # Store metadata
@@ -372,9 +744,12 @@ pattern_metadata = {
 'symbol': symbol,
 'pattern_type': pattern_type,
 'timestamp': datetime.now().isoformat(),
-'embedding': embedding,
 'metadata': metadata or {}
 }
+# The int8 matrix is the only copy of the vector in int8 mode
+if self.store_dtype != "int8":
+pattern_metadata['embedding'] = embedding
+self._pattern_rows[pattern_id] = len(self.metadata)
 self.metadata.append(pattern_metadata)
 
 logger.info(f"Added pattern {pattern_id} ({pattern_type}) for {symbol}")
@@ -405,7 +780,7 @@ Returns:
 List of similar patterns with scores
 """
 try:
-if self.index.ntotal == 0:
+if self._ntotal == 0:
 logger.warning("Vector database is empty")
 return []
 
@@ -418,16 +793,77 @@ query_embedding = query_embedding[:self.dimension]
 
 # Search in FAISS index
 query_2d = query_embedding.reshape(1, -1)
-distances, indices = self.index.search(query_2d, min(k * 2, self.index.ntotal))
+distances, indices = self._search_index(query_2d, min(k * 2, self._ntotal))
 
-results = []
-for i, (distance, idx) in enumerate(zip(distances[0], indices[0])):
-if idx == -1: # Invalid index
-continue
+results = self._build_search_results(distances[0], indices[0], k, pattern_type, symbol_filter)
 
-if idx >= len(self.metadata):
-continue
+logger.info(f"Found {len(results)} similar patterns")
+return results
+
+except Exception as e:
+logger.error(f"Error searching similar patterns: {e}")
+return []
+
+def search_similar_patterns_batch(self,
+query_embeddings: np.ndarray,
+k: int = 5,
+pattern_type: Optional[str] = None,
+symbol_filter: Optional[List[str]] = None) -> List[List[Dict[str, Any]]]:
+"""
+Search for similar patterns for several query embeddings in one index call.
+
+Args:
+query_embeddings: Query embedding matrix, one row per query
+k: Number of results to return per query
+pattern_type: Filter by pattern type
+symbol_filter: Filter by symbols
+
+Returns:
+List of similar-pattern lists, one per query row
+"""
+try:
+num_queries = len(query_embeddings)
+if self._ntotal == 0:
+logger.warning("Vector database is empty")
+return [[] for _ in range(num_queries)]
+
+if num_queries == 0:
+return []
+
+# Ensure correct dimension
+queries = np.asarray(query_embeddings, dtype=np.float32)
+if queries.shape[1] < self.dimension:
+queries = np.pad(queries, ((0, 0), (0, self.dimension - queries.shape[1])), 'constant')
+elif queries.shape[1] > self.dimension:
+queries = queries[:, :self.dimension]
+
+# Single multi-query search over the index
+distances, indices = self._search_index(queries, min(k * 2, self._ntotal))
+
+results = [
+self._build_search_results(distances[row], indices[row], k, pattern_type, symbol_filter)
+for row in range(num_queries)
+]
+
+logger.info(f"Batch search for {num_queries} queries found "
+f"{sum(len(r) for r in results)} similar patterns")
+return results
+
+except Exception as e:
+logger.error(f"Error searching similar patterns: {e}")
+return [[] for _ in range(len(query_embeddings))]
 
+def _build_search_results(self,
+distances: np.ndarray,
+indices: np.ndarray,
+k: int,
+pattern_type: Optional[str] = None,
+symbol_filter: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+"""Turn one row of FAISS search output into filtered result dicts."""
+# Row ids index straight into the metadata list; drop -1 padding and stale ids up front
+valid = (indices >= 0) & (indices < len(self.metadata))
+results = []
+for distance, idx in zip(distances[valid].tolist(), indices[valid].tolist()):
 metadata = self.metadata[idx]
 if metadata is None:
 continue
@@ -453,13 +889,8 @@ results.append(result)
 if len(results) >= k:
 break
 
-logger.info(f"Found {len(results)} similar patterns")
 return results
 
-except Exception as e:
-logger.error(f"Error searching similar patterns: {e}")
-return []
-
 def search_by_symbol_pattern(self,
 symbol: str,
 price_data: pd.Series,
@@ -492,6 +923,55 @@ Relevant patterns
 embedding = self.embedding_generator.create_text_embedding(query)
 return self.search_similar_patterns(embedding, k)
 
+def search_by_text_queries(self,
+queries: List[str],
+k: int = 5,
+chunk_size: int = 32) -> List[List[Dict[str, Any]]]:
+"""
+Search patterns for several natural language queries at once.
+
+Queries are encoded and searched in chunks; the next chunk is encoded
+in a background thread while the current one is searched.
+
+Args:
+queries: Natural language queries
+k: Number of results per query
+chunk_size: Queries encoded and searched per step
+
+Returns:
+Relevant patterns, one list per query
+"""
+if len(queries) <= chunk_size:
+embeddings = self.embedding_generator.create_text_embeddings(queries)
+return self.search_similar_patterns_batch(embeddings, k)
+
+chunks = [queries[i:i + chunk_size] for i in range(0, len(queries), chunk_size)]
+encode = self.embedding_generator.create_text_embeddings
+results = []
+
+with ThreadPoolExecutor(max_workers=1) as executor:
+pending = executor.submit(encode, chunks[0])
+for next_chunk in chunks[1:] + [None]:
+embeddings = pending.result()
+if next_chunk is not None:
+pending = executor.submit(encode, next_chunk)
+results.extend(self.search_similar_patterns_batch(embeddings, k))
+
+return results
+
+def warmup(self, queries: List[str], cache_file: Optional[str] = None) -> np.ndarray:
+"""
+Precompute embeddings for a known set of queries.
+
+Args:
+queries: Queries expected to be searched
+cache_file: Optional .npz file used to persist embeddings across runs
+
+Returns:
+Query embedding matrix, ready for search_similar_patterns_batch
+"""
+return self.embedding_generator.warmup(queries, cache_file)
+
 def get_pattern_statistics(self) -> Dict[str, Any]:
 """
 Get statistics about stored patterns.
@@ -519,6 +999,7 @@ return {
 'unique_symbols': len(symbols),
 'symbols': list(symbols),
 'index_type': self.index_type,
+'store_dtype': self.store_dtype,
 'dimension': self.dimension,
 'is_trained': getattr(self.index, 'is_trained', True)
 }
@@ -537,13 +1018,20 @@ try:
 if filepath is None:
 filepath = os.path.join(self.data_dir, f"faiss_index_{self.index_type.lower()}")
 
-# Save FAISS index
+# Save FAISS index; int8 stores have none and persist only the flat matrix
+if self.index is not None:
 faiss.write_index(self.index, f"{filepath}.index")
 
 # Save metadata
 with open(f"{filepath}.metadata", 'wb') as f:
 pickle.dump(self.metadata, f)
 
+# Save the flat matrix so load_index can memory-map it instead of rebuilding.
+# The current matrix may be a mapping of these very files, so write beside them and swap.
+if self.index_type == "Flat":
+_save_npy_atomic(f"{filepath}.vectors.npy", self._flat_vectors[:self._flat_count])
+_save_npy_atomic(f"{filepath}.scales.npy", self._flat_scales[:self._flat_count])
+
 logger.info(f"Saved FAISS index to {filepath}")
 return True
 
@@ -565,14 +1053,27 @@ try:
 if filepath is None:
 filepath = os.path.join(self.data_dir, f"faiss_index_{self.index_type.lower()}")
 
-# Load FAISS index
-if os.path.exists(f"{filepath}.index"):
+# Load FAISS index; int8 stores have none and load from metadata and the flat matrix
+if self.store_dtype == "int8":
+found = os.path.exists(f"{filepath}.metadata")
+else:
+found = os.path.exists(f"{filepath}.index")
+if found:
+if self.store_dtype != "int8":
 self.index = faiss.read_index(f"{filepath}.index")
 
 # Load metadata
 if os.path.exists(f"{filepath}.metadata"):
 with open(f"{filepath}.metadata", 'rb') as f:
 self.metadata = pickle.load(f)
+self._rebuild_pattern_rows()
+self._load_flat_vectors(filepath)
+self._normalize_legacy_flat_index()
+if self.store_dtype == "int8":
+# Metadata saved by older versions still carries float32 copies
+for meta in self.metadata:
+if meta:
+meta.pop('embedding', None)
 
 logger.info(f"Loaded FAISS index from {filepath}")
 return True
@@ -584,17 +1085,71 @@ except Exception as e:
 logger.error(f"Error loading FAISS index: {e}")
 return False
 
+def _load_flat_vectors(self, filepath: str):
+"""Memory-map the saved flat matrix, rebuilding it from metadata if missing or stale."""
+if self.index_type != "Flat":
+self._reset_flat_vectors()
+return
+
+vectors_file = f"{filepath}.vectors.npy"
+scales_file = f"{filepath}.scales.npy"
+
+# Open directly rather than stat first; a missing or truncated file just means rebuilding
+try:
+vectors = np.load(vectors_file, mmap_mode='r')
+scales = np.load(scales_file)
+except FileNotFoundError:
+self._rebuild_flat_vectors()
+return
+except (ValueError, OSError) as e:
+logger.warning(f"Could not map saved flat vectors in {vectors_file}, rebuilding: {e}")
+self._rebuild_flat_vectors()
+return
+
+if (vectors.shape == (len(self.metadata), self.dimension)
+and vectors.dtype == STORE_DTYPES[self.store_dtype]):
+# Read-only mapping; the first append copies it into a growable array
+self._flat_vectors = vectors
+self._flat_scales = scales
+self._flat_count = len(vectors)
+return
+
+logger.warning(f"Saved flat vectors in {vectors_file} do not match the index, rebuilding")
+self._rebuild_flat_vectors()
+
+def _normalize_legacy_flat_index(self):
+"""Re-add raw vectors from a Flat index saved before vectors were normalized."""
+if self.index is None or self.index_type != "Flat" or self.index.ntotal == 0:
+return
+vectors = self.index.reconstruct_n(0, self.index.ntotal)
+norms = np.linalg.norm(vectors, axis=1)
+if np.all((norms == 0) | (np.abs(norms - 1.0) < 1e-3)):
+return
+
+logger.info("Normalizing vectors of a legacy Flat index")
+self.index = faiss.IndexFlatL2(self.dimension)
+self.index.add(_l2_normalize(vectors))
+
+def _rebuild_pattern_rows(self):
+"""Rebuild the pattern_id -> row map from metadata."""
+self._pattern_rows = {meta['pattern_id']: row
+for row, meta in enumerate(self.metadata) if meta}
+
 def _get_embedding_by_id(self, pattern_id: str) -> Optional[np.ndarray]:
 """Get embedding by pattern ID."""
-for meta in self.metadata:
-if meta and meta.get('pattern_id') == pattern_id:
-return meta.get('embedding')
+row = self._pattern_rows.get(pattern_id)
+if row is None:
 return None
+if self.store_dtype == "int8":
+# Dequantized from the int8 matrix; unit length, as it was stored
+return self._flat_vectors[row].astype(np.float32) * self._flat_scales[row]
+return self.metadata[row].get('embedding')
 
 def clear_index(self):
 """Clear the vector database."""
 self._create_index()
 self.metadata = []
+self._pattern_rows = {}
 logger.info("Cleared FAISS vector database")
 
 
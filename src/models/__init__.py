@@ -0,0 +1,9 @@
+"""
+Models Package
+==============
+
+Statistical and machine learning models for the Multi-Market Correlation
+Engine, and the compiled kernels they use.
+"""
+
+__all__ = []
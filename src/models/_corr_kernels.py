@@ -0,0 +1,110 @@
+"""
+Numba kernels for rolling correlation
+=====================================
+
+JIT-compiled rolling-window Pearson correlation used by the analysis agent
+in place of pandas ``rolling().corr()``.
+
+Author: Multi-Market Correlation Engine Team
+Version: 1.0.0
+"""
+
+import numpy as np
+
+from .._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+
+# No fastmath here: the NaN result must survive
+@njit(cache=True)
+def _pearson(w: int, sx: float, sy: float, sxx: float, syy: float, sxy: float) -> float:
+    """Pearson correlation from window sums; NaN when either side is constant."""
+    den = (w * sxx - sx * sx) * (w * syy - sy * sy)
+    if den <= 0.0:
+        return np.nan
+    return (w * sxy - sx * sy) / np.sqrt(den)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def rolling_pearson_matrix(prices: np.ndarray, window: int) -> np.ndarray:
+    """
+    Pairwise Pearson correlation over every full window of a price panel.
+
+    Prefix sums of x, x² and of the count of observed values are built once
+    per column and shared by every pair; each pair adds one prefix sum of xy.
+    Any window's sums are then two subtractions, so the cost is O(N) per pair
+    regardless of the window.
+
+    NaN marks a missing observation. As with pandas ``rolling().corr()``, a
+    pair is NaN for any window in which either column has a gap, so one sparse
+    column only affects the pairs it belongs to.
+
+    Args:
+        prices: Contiguous float64 array of shape (N, K)
+        window: Window length W
+
+    Returns:
+        Array of shape (N - W + 1, K, K); entry t covers rows t .. t + W - 1
+    """
+    n_rows = prices.shape[0]
+    n_cols = prices.shape[1]
+    n_out = max(n_rows - window + 1, 0)
+    out = np.empty((n_out, n_cols, n_cols))
+    if n_out == 0:
+        return out
+
+    # Correlation is shift-invariant; centering keeps the prefix sums small.
+    # Gaps become zeros so they add nothing to the sums
+    centered = np.empty_like(prices)
+    for i in prange(n_cols):
+        total = 0.0
+        seen = 0
+        for t in range(n_rows):
+            if not np.isnan(prices[t, i]):
+                total += prices[t, i]
+                seen += 1
+        mean = total / seen if seen > 0 else 0.0
+        for t in range(n_rows):
+            x = prices[t, i]
+            centered[t, i] = 0.0 if np.isnan(x) else x - mean
+
+    # Row r of a prefix array holds the sum over rows 0 .. r - 1
+    sum_x = np.zeros((n_rows + 1, n_cols))
+    sum_xx = np.zeros((n_rows + 1, n_cols))
+    count = np.zeros((n_rows + 1, n_cols), dtype=np.int64)
+    for i in prange(n_cols):
+        for t in range(n_rows):
+            x = centered[t, i]
+            sum_x[t + 1, i] = sum_x[t, i] + x
+            sum_xx[t + 1, i] = sum_xx[t, i] + x * x
+            count[t + 1, i] = count[t, i] + (0 if np.isnan(prices[t, i]) else 1)
+
+    for t in prange(n_out):
+        for i in range(n_cols):
+            full = count[t + window, i] - count[t, i] == window
+            out[t, i, i] = 1.0 if full else np.nan
+
+    for i in prange(n_cols):
+        sum_xy = np.empty(n_rows + 1)
+        for j in range(i + 1, n_cols):
+            sum_xy[0] = 0.0
+            for t in range(n_rows):
+                sum_xy[t + 1] = sum_xy[t] + centered[t, i] * centered[t, j]
+
+            for t in range(n_out):
+                end = t + window
+                if (count[end, i] - count[t, i] < window
+                        or count[end, j] - count[t, j] < window):
+                    c = np.nan
+                else:
+                    c = _pearson(
+                        window,
+                        sum_x[end, i] - sum_x[t, i],
+                        sum_x[end, j] - sum_x[t, j],
+                        sum_xx[end, i] - sum_xx[t, i],
+                        sum_xx[end, j] - sum_xx[t, j],
+                        sum_xy[end] - sum_xy[t],
+                    )
+                out[t, i, j] = c
+                out[t, j, i] = c
+
+    return out
@@ -568,12 +568,15 @@ class WorkflowManager:
             cache_dir = "data/cache"
             os.makedirs(cache_dir, exist_ok=True)
             
-            with open(f"{cache_dir}/workflow_{workflow_id}.json", 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialize once and write the same bytes to both cache files
+            payload = json.dumps(data, indent=2).encode()
+            
+            with open(f"{cache_dir}/workflow_{workflow_id}.json", 'wb') as f:
+                f.write(payload)
                 
             # Also update the latest workflow cache
-            with open(f"{cache_dir}/latest_workflow.json", 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(f"{cache_dir}/latest_workflow.json", 'wb') as f:
+                f.write(payload)
                 
         except Exception as e:
             logger.error(f"Failed to cache frontend data: {e}")
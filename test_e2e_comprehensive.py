@@ -12,6 +12,18 @@ from typing import Dict, Any, List
 from datetime import datetime
 import subprocess
 import threading
+import socket
+
+def wait_for_port(port: int, host: str = "127.0.0.1", timeout: float = 30) -> bool:
+"""Wait until a server accepts TCP connections, instead of sleeping a fixed time."""
+deadline = time.monotonic() + timeout
+while time.monotonic() < deadline:
+with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+sock.settimeout(0.05)
+if sock.connect_ex((host, port)) == 0:
+return True
+time.sleep(0.02)
+return False
 
 class E2ETestSuite:
 def __init__(self):
@@ -510,9 +522,10 @@ if __name__ == "__main__":
 print("Multi-Market Correlation Engine - E2E Test Suite")
 print("Testing all frontend and backend features...")
 
-# Wait a moment for servers to be ready
-print("⏳ Waiting 5 seconds for servers to be ready...")
-time.sleep(5)
+# Wait for servers to be ready
+print("⏳ Waiting for servers to be ready...")
+wait_for_port(8000)
+wait_for_port(3000, host="localhost")
 
 tester = E2ETestSuite()
 tester.run_all_tests()
\ No newline at end of file
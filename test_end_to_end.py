@@ -16,6 +16,7 @@ import time
 import asyncio
 import threading
 import subprocess
+import socket
 import requests
 import pandas as pd
 import numpy as np
@@ -41,6 +42,18 @@ print(f" Import error: {e}")
 sys.exit(1)
 
 
+def wait_for_port(port: int, host: str = "127.0.0.1", timeout: float = 30) -> bool:
+"""Wait until a server accepts TCP connections, instead of sleeping a fixed time."""
+deadline = time.monotonic() + timeout
+while time.monotonic() < deadline:
+with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+sock.settimeout(0.05)
+if sock.connect_ex((host, port)) == 0:
+return True
+time.sleep(0.02)
+return False
+
+
 class EndToEndTester:
 """Comprehensive end-to-end test suite."""
 
@@ -49,12 +62,25 @@ def __init__(self):
 self.test_results = []
 self.api_server_process = None
 self.dashboard_process = None
+self.server_logs = [] # Files receiving server output, closed in cleanup()
 self.test_symbols = ['AAPL', 'MSFT', 'GOOGL']
 self.db_manager = None
 self.agent_coordinator = None
 self.api_base_url = "http://127.0.0.1:8000"
 self.dashboard_url = "http://127.0.0.1:8501"
 
+def open_server_log(self, name: str):
+"""
+Open logs/<name>.log for a server's output.
+
+Servers write straight to the file; an unread pipe would block them once
+its buffer filled up.
+"""
+os.makedirs("logs", exist_ok=True)
+log_file = open(os.path.join("logs", f"{name}.log"), "ab", buffering=0)
+self.server_logs.append(log_file)
+return log_file
+
 def log_test(self, test_name: str, success: bool, message: str = "", duration: float = 0):
 """Log test result with timing."""
 status = " PASS" if success else " FAIL"
@@ -334,10 +360,10 @@ sys.executable, "-m", "uvicorn",
 "--host", "127.0.0.1",
 "--port", "8000",
 "--log-level", "warning"
-], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+], stdout=self.open_server_log("e2e_api"), stderr=subprocess.STDOUT)
 
 # Wait for server to start
-time.sleep(8)
+wait_for_port(8000)
 
 # Test if server is running
 response = requests.get(f"{self.api_base_url}/health", timeout=10)
@@ -468,10 +494,10 @@ sys.executable, "-m", "streamlit", "run",
 "--server.address", "127.0.0.1",
 "--browser.gatherUsageStats", "false",
 "--server.headless", "true"
-], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+], stdout=self.open_server_log("e2e_dashboard"), stderr=subprocess.STDOUT)
 
 # Wait for dashboard to start
-time.sleep(10)
+wait_for_port(8501)
 
 # Test if dashboard is accessible
 response = requests.get(self.dashboard_url, timeout=15)
@@ -643,6 +669,10 @@ print(" Dashboard stopped")
 except Exception as e:
 print(f" Error stopping dashboard: {e}")
 
+for log_file in self.server_logs:
+log_file.close()
+self.server_logs = []
+
 def generate_report(self):
 """Generate comprehensive test report."""
 print("\n" + "=" * 70)
@@ -14,9 +14,8 @@ import sys
 import os
 import time
 import traceback
+import importlib.util
 from datetime import datetime
-import pandas as pd
-import numpy as np
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -26,6 +25,7 @@ def test_vector_database():
 print(" Testing FAISS Vector Database...")
 
 try:
+import pandas as pd
 from src.data.vector_database import get_vector_db, FinancialEmbedding
 
 # Initialize vector database
@@ -71,6 +71,15 @@ print(f" Pattern added to vector DB: {success}")
 results = vector_db.search_by_text_query("tech stock volatility", k=3)
 print(f" Similarity search completed: {len(results)} results")
 
+# Test batched similarity search with precomputed query embeddings
+search_queries = ["tech stock volatility", "bond market correlation"]
+query_embeddings = vector_db.warmup(
+search_queries,
+cache_file=os.path.join(vector_db.data_dir, "demo_warmup.npz")
+)
+batch_results = vector_db.search_similar_patterns_batch(query_embeddings, k=3)
+print(f" Batched similarity search completed: {[len(r) for r in batch_results]} results")
+
 # Test vector database statistics
 stats = vector_db.get_pattern_statistics()
 print(f" Vector DB stats: {stats}")
@@ -88,6 +97,7 @@ def test_llm_engine():
 print("\n Testing Llama LLM Engine...")
 
 try:
+import pandas as pd
 from src.models.llm_engine import get_llm_engine
 
 # Initialize LLM engine
@@ -196,70 +206,70 @@ def test_api_endpoints():
 print("\n Testing LLM API Endpoints...")
 
 try:
-import requests
+import asyncio
+return asyncio.run(_check_api_endpoints())
+
+except Exception as e:
+print(f" API endpoints test failed: {e}")
+print(f"Traceback: {traceback.format_exc()}")
+return False
+
+
+async def _check_api_endpoints():
+"""Check the LLM endpoints concurrently over one shared async client."""
+import asyncio
+import httpx
 
+async with httpx.AsyncClient(base_url="http://127.0.0.1:8000", timeout=30) as client:
 # Check if API server is running
 try:
-response = requests.get("http://127.0.0.1:8000/health", timeout=5)
+response = await client.get("/health", timeout=5)
 if response.status_code != 200:
 print(" API server not running - skipping endpoint tests")
 return True
-except:
+except httpx.HTTPError:
 print(" API server not accessible - skipping endpoint tests")
 return True
 
-# Test LLM status endpoint
-response = requests.get("http://127.0.0.1:8000/llm/status", timeout=10)
-if response.status_code == 200:
-print(" LLM status endpoint working")
-else:
-print(f" LLM status endpoint returned {response.status_code}")
-
-# Test chat endpoint
-chat_response = requests.post(
-"http://127.0.0.1:8000/llm/chat",
+# Fire the remaining checks together; wall time is the slowest call, not the sum
+checks = [
+("LLM status", client.get("/llm/status", timeout=10)),
+("LLM chat", client.post(
+"/llm/chat",
 json={
 "query": "What is financial correlation analysis?",
 "user_id": "test_user"
-},
-timeout=30
-)
-
-if chat_response.status_code == 200:
-print(" LLM chat endpoint working")
-else:
-print(f" LLM chat endpoint returned {chat_response.status_code}")
-
-# Test vector search endpoint
-search_response = requests.post(
-"http://127.0.0.1:8000/llm/vector/search",
+}
+)),
+("Vector search", client.post(
+"/llm/vector/search",
 json={
 "query_type": "text",
 "query_data": "tech stock patterns",
 "k": 5
-},
-timeout=30
-)
+}
+)),
+# Batched vector search (several queries, one index call)
+("Batched vector search", client.post(
+"/llm/vector/search",
+json={
+"queries": ["tech stock patterns", "bond market correlation", "energy sector volatility"],
+"k": 3
+}
+)),
+("Vector stats", client.get("/llm/vector/stats", timeout=10))
+]
 
-if search_response.status_code == 200:
-print(" Vector search endpoint working")
-else:
-print(f" Vector search endpoint returned {search_response.status_code}")
+responses = await asyncio.gather(*(request for _, request in checks))
 
-# Test vector statistics endpoint
-stats_response = requests.get("http://127.0.0.1:8000/llm/vector/stats", timeout=10)
-if stats_response.status_code == 200:
-print(" Vector stats endpoint working")
+for (name, _), response in zip(checks, responses):
+if response.status_code == 200:
+print(f" {name} endpoint working")
 else:
-print(f" Vector stats endpoint returned {stats_response.status_code}")
+print(f" {name} endpoint returned {response.status_code}")
 
 return True
 
-except Exception as e:
-print(f" API endpoints test failed: {e}")
-print(f"Traceback: {traceback.format_exc()}")
-return False
-
 
 def test_dashboard_integration():
 """Test dashboard integration."""
@@ -288,6 +298,7 @@ def test_integration_workflow():
 print("\n Testing End-to-End Integration Workflow...")
 
 try:
+import pandas as pd
 from src.data.vector_database import get_vector_db
 from src.models.llm_engine import get_llm_engine
 from src.agents.llm_agent import LLMAgent
@@ -368,15 +379,15 @@ dependencies = {
 'numpy': 'numpy',
 'pandas': 'pandas',
 'streamlit': 'streamlit',
-'requests': 'requests'
+'httpx': 'httpx'
 }
 
+# Locate packages without importing them; each test imports only what it uses
 missing_deps = []
 for dep_name, import_name in dependencies.items():
-try:
-__import__(import_name)
+if importlib.util.find_spec(import_name) is not None:
 print(f" {dep_name}")
-except ImportError:
+else:
 print(f" {dep_name} - Missing")
 missing_deps.append(dep_name)
 